@@ -0,0 +1,95 @@
+"""
+Feed parse benchmark: fast_feed.parse_entries (stop after N entries) vs. feedparser.
+
+    python -m benchmarks.bench_feed_parse --entries 8 --article-kb 20 --repeat 5
+
+Parses every recorded feed in benchmarks/fixtures/ (see `fixture_server record`)
+plus synthetic large feeds: RSS items padded with full-article HTML and a
+100-entry ArXiv Atom page. Reports median parse time, peak traced memory, which
+parser answered, and whether both paths agree on the first N titles and links.
+"""
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import feedparser
+
+from benchmarks.fixture_server import FIXTURES_DIR, FixtureConfig, synthetic_arxiv, synthetic_rss
+from core.utils.fast_feed import parse_entries
+
+
+def load_feeds(fixtures_dir: Path, article_kb: int, items: int) -> List[Tuple[str, bytes]]:
+    feeds = [(f"recorded/{p.stem[:10]}", p.read_bytes()) for p in sorted(fixtures_dir.glob("*.xml"))]
+    cfg = FixtureConfig(article_kb=article_kb, items_per_feed=items)
+    feeds.append((f"synthetic/rss-{items}x{article_kb}kb", synthetic_rss("https://example.com/feed", cfg)))
+    feeds.append(("synthetic/rss-plain", synthetic_rss("https://example.com/plain", FixtureConfig(items_per_feed=items))))
+    feeds.append(("synthetic/arxiv-atom-100", synthetic_arxiv({"max_results": ["100"]}, FixtureConfig())))
+    return feeds
+
+
+def _fast_path(body: bytes, n: int) -> Tuple[List[Any], str]:
+    feed = parse_entries(body, n)
+    if feed is None:
+        return feedparser.parse(body).entries[:n], "feedparser"
+    return feed.entries, "fast"
+
+
+def _feedparser_path(body: bytes, n: int) -> Tuple[List[Any], str]:
+    return feedparser.parse(body).entries[:n], "feedparser"
+
+
+def measure(fn: Callable[[bytes, int], Tuple[List[Any], str]], body: bytes, n: int, repeat: int) -> Dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entries, parser = fn(body, n)
+        times.append(time.perf_counter() - start)
+
+    # Separate pass: tracemalloc slows parsing down several times
+    tracemalloc.start()
+    fn(body, n)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_ms": round(statistics.median(times) * 1000, 2), "peak_kb": round(peak / 1024, 1),
+            "parser": parser, "entries": entries}
+
+
+def _key(entry: Any) -> Tuple[str, str]:
+    return entry.get("title", ""), entry.get("link", "")
+
+
+def bench(feeds: List[Tuple[str, bytes]], n: int, repeat: int) -> List[Dict[str, Any]]:
+    rows = []
+    for name, body in feeds:
+        baseline = measure(_feedparser_path, body, n, repeat)
+        fast = measure(_fast_path, body, n, repeat)
+        rows.append({
+            "feed": name,
+            "kb": round(len(body) / 1024, 1),
+            "feedparser_ms": baseline["median_ms"],
+            "fast_ms": fast["median_ms"],
+            "speedup": round(baseline["median_ms"] / fast["median_ms"], 1) if fast["median_ms"] else None,
+            "feedparser_peak_kb": baseline["peak_kb"],
+            "fast_peak_kb": fast["peak_kb"],
+            "parser": fast["parser"],
+            "entries": len(fast["entries"]),
+            "agree": [_key(e) for e in fast["entries"]] == [_key(e) for e in baseline["entries"]],
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=8, help="entries kept per feed")
+    parser.add_argument("--article-kb", type=int, default=20, help="HTML per synthetic RSS item")
+    parser.add_argument("--items", type=int, default=40, help="items per synthetic RSS feed")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fixtures-dir", default=str(FIXTURES_DIR))
+    args = parser.parse_args()
+
+    feeds = load_feeds(Path(args.fixtures_dir), args.article_kb, args.items)
+    print(json.dumps(bench(feeds, args.entries, args.repeat), indent=2))
@@ -0,0 +1,153 @@
+"""
+Writer-engine throughput benchmark against the local LLM stub.
+
+    python -m benchmarks.bench_llm --calls 40 --max-in-flight 8 --latency-ms 600 --rate-429 0.05
+
+Measures calls per minute and p50 / p95 / p99 latency for InsightEngine.analyze_paper,
+InsightEngine.deep_dive and DigestEngine.generate_news_digest, with the response
+cache off (pass --cache to measure the cached path). Prints a JSON report.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Tuple
+
+import requests
+
+from benchmarks.llm_stub import add_stub_args, config_from_args, llm_stub_server
+from core.utils.rate_limit import RateLimiter, bounded_map
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(q / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def make_papers(n: int) -> List[Dict[str, Any]]:
+    return [{
+        "title": f"Benchmark Paper {i}: Scaling Test-Time Reasoning",
+        "authors": [f"Author {i}-{j}" for j in range(4)],
+        "abstract": f"Paper {i}. " + "We study reasoning under a fixed compute budget. " * 20,
+        "links": {"github": f"https://github.com/org/repo{i}"},
+    } for i in range(n)]
+
+
+def make_news_batches(n: int, per_batch: int = 15) -> List[List[Dict[str, Any]]]:
+    return [[{
+        "source": f"Source {j}",
+        "title": f"Story {i}-{j}: lab ships model update number {i * per_batch + j}",
+        "summary": f"Batch {i} item {j}. " + "Details of the release and its benchmarks. " * 4,
+    } for j in range(per_batch)] for i in range(n)]
+
+
+def _failed(result: Any) -> bool:
+    if isinstance(result, dict):
+        return "error" in result or result.get("verdict") == "ERROR"
+    return isinstance(result, str) and result.startswith("Digest 生成失败")
+
+
+def run_workload(name: str, fn: Callable[[Any], Any], items: List[Any], max_in_flight: int,
+                 limiter: RateLimiter, stub_url: str) -> Dict[str, Any]:
+    def timed(item: Any) -> Tuple[float, bool]:
+        start = time.perf_counter()
+        result = fn(item)
+        return time.perf_counter() - start, _failed(result)
+
+    before = _stub_stats(stub_url)
+    start = time.perf_counter()
+    outcomes = bounded_map(timed, items, max_in_flight, limiter)
+    wall = time.perf_counter() - start
+    after = _stub_stats(stub_url)
+
+    latencies = [t for t, _ in outcomes]
+    errors = sum(1 for _, failed in outcomes if failed)
+    return {
+        "workload": name,
+        "calls": len(items),
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "per_minute": round((len(items) - errors) / wall * 60, 1) if wall else None,
+        "p50_s": round(percentile(latencies, 50), 3),
+        "p95_s": round(percentile(latencies, 95), 3),
+        "p99_s": round(percentile(latencies, 99), 3),
+        "stub": {k: after.get(k, 0) - before.get(k, 0) for k in after},
+    }
+
+
+def _stub_stats(stub_url: str) -> Dict[str, int]:
+    return requests.get(stub_url.rsplit("/v1", 1)[0] + "/__stats", timeout=5).json()
+
+
+def main() -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workloads", default="analyze_paper,deep_dive,news_digest")
+    parser.add_argument("--calls", type=int, default=40, help="calls per workload")
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--rpm", type=float, default=0, help="client-side request limit (0 = none)")
+    parser.add_argument("--client-timeout", type=float, default=30.0, help="LLM_TIMEOUT for the SDK")
+    parser.add_argument("--client-retries", type=int, default=2, help="LLM_MAX_RETRIES for the SDK")
+    parser.add_argument("--cache", action="store_true", help="keep the LLM response cache on")
+    parser.add_argument("--out", help="also write the report to this file")
+    add_stub_args(parser)
+    args = parser.parse_args()
+
+    stub_cfg = config_from_args(args)
+    out = os.path.abspath(args.out) if args.out else None
+    report: Dict[str, Any] = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "stub": asdict(stub_cfg),
+        "max_in_flight": args.max_in_flight,
+        "rpm": args.rpm,
+        "cache": args.cache,
+        "results": [],
+    }
+
+    with llm_stub_server(stub_cfg) as stub_url:
+        os.environ.update({
+            "LLM_BASE_URL": stub_url,
+            "DEEPSEEK_API_KEY": "stub",
+            "LLM_TIMEOUT": str(args.client_timeout),
+            "LLM_MAX_RETRIES": str(args.client_retries),
+            "LLM_CACHE": "1" if args.cache else "0",
+        })
+        # Response cache and dedup signatures (outputs/cache/...) go to a scratch dir
+        os.chdir(tempfile.mkdtemp(prefix="radar-llm-bench-"))
+
+        from core.writers.insight_engine import InsightEngine
+        from core.writers.digest_engine import DigestEngine
+        insight, digest = InsightEngine(), DigestEngine()
+
+        workloads = {
+            "analyze_paper": (insight.analyze_paper, make_papers(args.calls)),
+            "deep_dive": (insight.deep_dive, make_papers(args.calls)),
+            "news_digest": (digest.generate_news_digest, make_news_batches(args.calls)),
+        }
+        limiter = RateLimiter(rpm=args.rpm or None)
+        for name in [w.strip() for w in args.workloads.split(",") if w.strip()]:
+            if name not in workloads:
+                parser.error(f"unknown workload: {name}")
+            fn, items = workloads[name]
+            result = run_workload(name, fn, items, args.max_in_flight, limiter, stub_url)
+            report["results"].append(result)
+            print(json.dumps(result, ensure_ascii=False), file=sys.stderr)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
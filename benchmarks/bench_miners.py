@@ -0,0 +1,131 @@
+"""
+Offline refresh benchmark: every miner and page fetch helper against the fixture server.
+
+    python -m benchmarks.bench_miners --runs 2 --latency-ms 80 --error-rate 0.05 --out run.json
+
+Reports wall time, CPU time, requests, bytes and injected errors per miner as JSON.
+Run 1 starts from empty caches (a fresh --workdir); later runs show the warm path.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fixture_server import (
+    add_fault_args, config_from_args, fixture_server, replay_http, server_stats,
+)
+from core.utils.config_loader import ConfigLoader
+from core.miners.arxiv_miner import ArxivMiner
+from core.miners.interview_miner import InterviewMiner
+from core.miners.news_miner import NewsMiner
+from core.miners.reddit_miner import RedditMiner
+from core.miners.safety_miner import SafetyMiner
+from core.miners import section_feeds
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _news(config: ConfigLoader, args) -> List[Any]:
+    miner = NewsMiner(config)
+    return [item for category in miner.feeds for item in miner.fetch_by_category(category, max_items=10)]
+
+
+MINERS: Dict[str, Callable[[ConfigLoader, argparse.Namespace], List[Any]]] = {
+    "news": _news,
+    "arxiv": lambda config, args: ArxivMiner(config).fetch_latest_papers(max_results=args.papers),
+    "reddit": lambda config, args: RedditMiner(config).fetch_community_pulse(),
+    "safety": lambda config, args: SafetyMiner(config).fetch_safety_reports(),
+    "interview": lambda config, args: InterviewMiner(config).fetch_interviews(),
+    "page_news": lambda config, args: section_feeds.fetch_all_news(config, max_per_source=8),
+    "page_products": lambda config, args: section_feeds.fetch_products(config),
+    "page_discourse": lambda config, args: section_feeds.fetch_discourse(config),
+    "page_podcasts": lambda config, args: section_feeds.fetch_podcasts(config),
+}
+
+
+def run_miner(name: str, config: ConfigLoader, args, base_url: str) -> Dict[str, Any]:
+    server_stats(base_url, reset=True)
+    error = None
+    items: List[Any] = []
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        items = MINERS[name](config, args)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    stats = server_stats(base_url)
+
+    result = {
+        "miner": name,
+        "wall_s": round(wall, 4),
+        "cpu_s": round(cpu, 4),
+        "requests": stats["requests"],
+        "bytes": stats["bytes"],
+        "injected_errors": stats["errors"],
+        "items": len(items),
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+def main() -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--miners", default=",".join(MINERS), help="comma-separated subset of: " + ", ".join(MINERS))
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--papers", type=int, default=100, help="ArXiv max_results")
+    parser.add_argument("--workdir", help="where caches and stores are written (default: a fresh temp dir)")
+    parser.add_argument("--out", help="also write the report to this file")
+    add_fault_args(parser)
+    args = parser.parse_args()
+
+    miners = [m.strip() for m in args.miners.split(",") if m.strip()]
+    unknown = set(miners) - set(MINERS)
+    if unknown:
+        parser.error(f"unknown miners: {', '.join(sorted(unknown))}")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    config = ConfigLoader(str(REPO_ROOT / "config"))
+    cfg = config_from_args(args, names=sorted(config.snapshot().author_names)[:50])
+    out = Path(args.out).resolve() if args.out else None
+
+    report: Dict[str, Any] = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "fixtures": asdict(cfg),
+        "github_token": bool(os.getenv("GITHUB_TOKEN")),
+        "results": [],
+    }
+    with fixture_server(cfg) as base_url:
+        # Relative cache / store paths (outputs/...) land in the work dir, not the checkout
+        workdir = args.workdir or tempfile.mkdtemp(prefix="radar-bench-")
+        os.makedirs(workdir, exist_ok=True)
+        os.chdir(workdir)
+        report["workdir"] = workdir
+
+        with replay_http(base_url):
+            for run in range(1, args.runs + 1):
+                for name in miners:
+                    result = run_miner(name, config, args, base_url)
+                    result["run"] = run
+                    report["results"].append(result)
+                    print(json.dumps(result), file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if out:
+        out.write_text(text)
+    print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
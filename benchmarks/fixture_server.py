@@ -0,0 +1,403 @@
+"""
+Local fixture server for offline benchmarks.
+
+Serves recorded feed bodies (benchmarks/fixtures/, see `record`) and falls back to
+deterministic synthetic RSS, ArXiv Atom pages and GitHub / Hugging Face JSON.
+Latency, jitter, 5xx errors and slow responses can be injected; --article-kb pads
+synthetic items with full-article HTML. Bodies are gzipped when the client asks.
+
+    python -m benchmarks.fixture_server record        # snapshot live feeds into fixtures/
+    python -m benchmarks.fixture_server serve --port 8765 --latency-ms 80
+
+Clients are pointed at it with replay_http(base_url): every outgoing `requests`
+call is rewritten to {base_url}/{scheme}/{host}{path}.
+"""
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
+import multiprocessing
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+import requests
+from requests.adapters import HTTPAdapter
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_WORDS = (
+    "model agent reasoning benchmark open weights inference training alignment safety robot "
+    "vision language multimodal diffusion retrieval context window tokenizer chip cluster "
+    "latency throughput distillation quantization fine-tuning evaluation dataset release launch "
+    "policy regulation startup funding research preview api pricing developer platform"
+).split()
+_GUESTS = ["Andrej Karpathy", "Ilya Sutskever", "Demis Hassabis", "Dario Amodei", "Yann LeCun"]
+
+
+@dataclass
+class FixtureConfig:
+    latency_ms: float = 50.0
+    jitter_ms: float = 20.0
+    error_rate: float = 0.0      # share of requests answered with 503
+    slow_rate: float = 0.0       # share of requests delayed by slow_s
+    slow_s: float = 5.0
+    items_per_feed: int = 20
+    article_kb: int = 0          # full-article HTML appended to each synthetic RSS item
+    compress: bool = True        # gzip bodies for clients sending Accept-Encoding: gzip
+    arxiv_total: int = 2000
+    seed: int = 7
+    fixtures_dir: str = str(FIXTURES_DIR)
+    names: List[str] = field(default_factory=list)   # author names planted into ArXiv entries
+
+
+def _fixture_path(fixtures_dir: Path, url: str) -> Path:
+    return fixtures_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.xml"
+
+
+def _rng(*parts) -> random.Random:
+    digest = hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def synthetic_rss(url: str, cfg: FixtureConfig) -> bytes:
+    """RSS 2.0 feed; a third of the items are shared stories, so feeds overlap like real news."""
+    rng = _rng(cfg.seed, url)
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(cfg.items_per_feed):
+        if rng.random() < 0.33:
+            story = _rng(cfg.seed, "story", rng.randrange(40))
+            title = _sentence(story, 8).capitalize()
+            summary = _sentence(story, 60)
+        else:
+            title = _sentence(rng, 8).capitalize()
+            summary = _sentence(rng, 60)
+        if rng.random() < 0.2:
+            summary += f" With {rng.choice(_GUESTS)}."
+        if cfg.article_kb:
+            paragraphs = "".join(f"<p>{_sentence(rng, 40)}</p>" for _ in range(cfg.article_kb * 4))
+            summary += f"<div class='article'>{paragraphs}</div>"
+        published = format_datetime(now - timedelta(hours=i * 3 + rng.random()))
+        items.append(
+            f"<item><title>{escape(title)}</title><link>{escape(url)}/item/{i}</link>"
+            f"<guid>{escape(url)}/item/{i}</guid><pubDate>{published}</pubDate>"
+            f"<description>{escape(summary)}</description></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{escape(url)}</title><link>{escape(url)}</link><description>fixture</description>"
+        + "".join(items) + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def synthetic_arxiv(query: Dict[str, List[str]], cfg: FixtureConfig) -> bytes:
+    """One ArXiv API page, newest first; ~40% of abstracts link GitHub, ~20% Hugging Face."""
+    start = int(query.get("start", ["0"])[0])
+    size = int(query.get("max_results", ["100"])[0])
+    end = min(start + size, cfg.arxiv_total)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    entries = []
+    for n in range(start, end):
+        rng = _rng(cfg.seed, "arxiv", n)
+        published = (now - timedelta(minutes=7 * n)).isoformat().replace("+00:00", "Z")
+        abstract = _sentence(rng, 150)
+        if rng.random() < 0.4:
+            abstract += f" Code: https://github.com/org{n % 97}/repo{n}"
+        if rng.random() < 0.2:
+            abstract += f" Weights: https://huggingface.co/org{n % 31}/model-{n}"
+        authors = [_sentence(rng, 2).title() for _ in range(rng.randint(2, 6))]
+        if cfg.names and rng.random() < 0.1:
+            authors.append(rng.choice(cfg.names))
+        arxiv_id = f"{2400 + n // 100000}.{n % 100000:05d}"
+        entries.append(
+            f"<entry><id>http://arxiv.org/abs/{arxiv_id}v1</id><updated>{published}</updated>"
+            f"<published>{published}</published><title>{escape(_sentence(rng, 10).title())}</title>"
+            f"<summary>{escape(abstract)}</summary>"
+            + "".join(f"<author><name>{escape(a)}</name></author>" for a in authors)
+            + f'<link href="http://arxiv.org/abs/{arxiv_id}v1" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/{arxiv_id}v1" rel="related" type="application/pdf"/>'
+            '<arxiv:primary_category term="cs.CL"/><category term="cs.CL"/><category term="cs.AI"/></entry>'
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom"><title>ArXiv Query</title>'
+        f"<opensearch:totalResults>{cfg.arxiv_total}</opensearch:totalResults>"
+        f"<opensearch:startIndex>{start}</opensearch:startIndex>"
+        f"<opensearch:itemsPerPage>{size}</opensearch:itemsPerPage>"
+        + "".join(entries) + "</feed>"
+    ).encode("utf-8")
+
+
+def _count(cfg: FixtureConfig, *key) -> int:
+    return _rng(cfg.seed, "count", *key).randint(0, 5000)
+
+
+def github_json(path: str, body: bytes, cfg: FixtureConfig) -> bytes:
+    if path == "/graphql":
+        variables = json.loads(body or b"{}").get("variables", {})
+        data = {}
+        for alias in re.findall(r"\b(r\d+)\s*:\s*repository", json.loads(body).get("query", "")):
+            n = alias[1:]
+            data[alias] = {"stargazerCount": _count(cfg, variables.get(f"o{n}"), variables.get(f"n{n}"))}
+        return json.dumps({"data": data}).encode("utf-8")
+    parts = path.strip("/").split("/")
+    owner, name = (parts[1], parts[2]) if len(parts) >= 3 else ("", "")
+    return json.dumps({"full_name": f"{owner}/{name}", "stargazers_count": _count(cfg, owner, name)}).encode("utf-8")
+
+
+def hf_json(path: str, cfg: FixtureConfig) -> bytes:
+    model_id = path.split("/api/models/", 1)[-1]
+    return json.dumps({"id": model_id, "likes": _count(cfg, model_id)}).encode("utf-8")
+
+
+class _Stats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.bytes = 0
+            self.errors = 0
+            self.by_host: Dict[str, Dict[str, int]] = {}
+
+    def record(self, host: str, size: int, error: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+            self.errors += int(error)
+            h = self.by_host.setdefault(host, {"requests": 0, "bytes": 0, "errors": 0})
+            h["requests"] += 1
+            h["bytes"] += size
+            h["errors"] += int(error)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"requests": self.requests, "bytes": self.bytes, "errors": self.errors,
+                    "by_host": {k: dict(v) for k, v in self.by_host.items()}}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FixtureServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle(b"")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._handle(self.rfile.read(length))
+
+    def _send(self, status: int, body: bytes, content_type: str) -> int:
+        """Returns the number of body bytes written (after compression)."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if self.server.cfg.compress and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def _handle(self, body: bytes) -> None:
+        srv, cfg = self.server, self.server.cfg
+        if self.path == "/__stats":
+            return self._send(200, json.dumps(srv.stats.snapshot()).encode("utf-8"), "application/json")
+        if self.path == "/__reset":
+            srv.stats.reset()
+            return self._send(200, b"{}", "application/json")
+
+        # /{scheme}/{host}/{path}?{query}
+        parts = urlsplit(self.path)
+        scheme, _, rest = parts.path.lstrip("/").partition("/")
+        host, _, path = rest.partition("/")
+        path = "/" + path
+        url = f"{scheme}://{host}{path}" + (f"?{parts.query}" if parts.query else "")
+
+        with srv.rng_lock:
+            delay = max(0.0, srv.rng.gauss(cfg.latency_ms, cfg.jitter_ms) / 1000.0)
+            if srv.rng.random() < cfg.slow_rate:
+                delay += cfg.slow_s
+            failed = srv.rng.random() < cfg.error_rate
+        time.sleep(delay)
+
+        if failed:
+            payload, status, ctype = b"injected error", 503, "text/plain"
+        elif "arxiv.org" in host:
+            payload, status, ctype = synthetic_arxiv(parse_qs(parts.query), cfg), 200, "application/atom+xml"
+        elif host == "api.github.com":
+            payload, status, ctype = github_json(path, body, cfg), 200, "application/json"
+        elif host == "huggingface.co" and path.startswith("/api/models/"):
+            payload, status, ctype = hf_json(path, cfg), 200, "application/json"
+        else:
+            recorded = _fixture_path(Path(cfg.fixtures_dir), url)
+            payload = recorded.read_bytes() if recorded.exists() else synthetic_rss(url, cfg)
+            status, ctype = 200, "application/xml"
+
+        srv.stats.record(host, self._send(status, payload, ctype), failed)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, cfg: FixtureConfig, port: int = 0):
+        super().__init__(("127.0.0.1", port), FixtureHandler)
+        self.cfg = cfg
+        self.stats = _Stats()
+        self.rng = random.Random(cfg.seed)
+        self.rng_lock = threading.Lock()
+
+    def handle_error(self, request, client_address):
+        # Clients that cut a download short (FeedFetcher's byte / time ceilings) reset the connection
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def _serve(cfg: FixtureConfig, port_queue) -> None:
+    server = FixtureServer(cfg)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+@contextlib.contextmanager
+def fixture_server(cfg: FixtureConfig) -> Iterator[str]:
+    """
+    Runs the server in a child process (so its CPU time is not charged to the
+    code under test) and yields its base URL.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    port_queue = ctx.Queue()
+    proc = ctx.Process(target=_serve, args=(cfg, port_queue), daemon=True)
+    proc.start()
+    try:
+        yield f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+    finally:
+        proc.terminate()
+        proc.join(5)
+
+
+@contextlib.contextmanager
+def replay_http(base_url: str) -> Iterator[None]:
+    """Sends every `requests` call made inside the block to the fixture server."""
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, *args, **kwargs):
+        if not request.url.startswith(base_url):
+            parts = urlsplit(request.url)
+            request.url = f"{base_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}" + (
+                f"?{parts.query}" if parts.query else "")
+        return original_send(adapter, request, *args, **kwargs)
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original_send
+
+
+def server_stats(base_url: str, reset: bool = False) -> dict:
+    stats = requests.get(f"{base_url}/__stats", timeout=5).json()
+    if reset:
+        requests.get(f"{base_url}/__reset", timeout=5)
+    return stats
+
+
+def record(urls: List[str], fixtures_dir: Path = FIXTURES_DIR, timeout: float = 15.0) -> Tuple[int, int]:
+    """Snapshots live feed bodies; returns (recorded, failed)."""
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    ok = failed = 0
+    manifest = {}
+    for url in urls:
+        try:
+            resp = requests.get(url, timeout=timeout, headers={"User-Agent": "AI-Radar/1.0 fixture recorder"})
+            resp.raise_for_status()
+            path = _fixture_path(fixtures_dir, url)
+            path.write_bytes(resp.content)
+            manifest[path.name] = url
+            ok += 1
+        except requests.RequestException as e:
+            print(f"skip {url}: {e}")
+            failed += 1
+    index = fixtures_dir / "index.json"
+    known = json.loads(index.read_text()) if index.exists() else {}
+    known.update(manifest)
+    index.write_text(json.dumps(known, indent=2, sort_keys=True))
+    return ok, failed
+
+
+def _feed_urls() -> List[str]:
+    from core.utils.config_loader import ConfigLoader
+    from core.miners.news_miner import NewsMiner
+
+    config = ConfigLoader()
+    urls = [url for section in config.snapshot().feed_urls.values() for url in section]
+    for feeds in NewsMiner(config).feeds.values():
+        urls.extend(feeds.values())
+    return list(dict.fromkeys(urls))
+
+
+def add_fault_args(parser: argparse.ArgumentParser) -> None:
+    defaults = FixtureConfig()
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--slow-rate", type=float, default=defaults.slow_rate)
+    parser.add_argument("--slow-s", type=float, default=defaults.slow_s)
+    parser.add_argument("--items-per-feed", type=int, default=defaults.items_per_feed)
+    parser.add_argument("--article-kb", type=int, default=defaults.article_kb)
+    parser.add_argument("--no-compress", dest="compress", action="store_false")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--fixtures-dir", default=defaults.fixtures_dir)
+
+
+def config_from_args(args: argparse.Namespace, **extra) -> FixtureConfig:
+    return FixtureConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        slow_rate=args.slow_rate, slow_s=args.slow_s, items_per_feed=args.items_per_feed,
+        article_kb=args.article_kb, compress=args.compress, seed=args.seed, fixtures_dir=args.fixtures_dir, **extra,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("record", help="fetch every configured feed once and store its body")
+    serve = sub.add_parser("serve", help="run the fixture server in the foreground")
+    serve.add_argument("--port", type=int, default=8765)
+    add_fault_args(serve)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        ok, failed = record(_feed_urls())
+        print(json.dumps({"recorded": ok, "failed": failed, "dir": str(FIXTURES_DIR)}))
+    else:
+        cfg = config_from_args(args)
+        server = FixtureServer(cfg, args.port)
+        print(f"Serving fixtures on {server.base_url} ({json.dumps(asdict(cfg))})")
+        server.serve_forever()
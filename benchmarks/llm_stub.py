@@ -0,0 +1,276 @@
+"""
+Local OpenAI-compatible chat-completions stand-in for load-testing the writer engines.
+
+    python -m benchmarks.llm_stub --port 8766 --latency-ms 800 --rate-429 0.05
+    LLM_BASE_URL=http://127.0.0.1:8766/v1 DEEPSEEK_API_KEY=stub streamlit run interface/Home.py
+
+Answers POST /v1/chat/completions (plain and stream=true) with canned JSON / markdown
+templated on the paper title in the prompt. Latency is lognormal around --latency-ms
+plus --ms-per-token per generated token; 429s (with Retry-After) and hung requests
+(--timeout-rate, held for --hang-s) can be injected.
+"""
+import argparse
+import contextlib
+import json
+import math
+import multiprocessing
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, Optional
+
+ANALYZE_TEMPLATE = {
+    "tldr": "{title}: 一句话总结",
+    "innovation_score": "7",
+    "reality_check": "方法扎实，但评测规模有限。",
+    "verdict": "OPTIONAL",
+}
+
+DEEP_DIVE_TEMPLATE = {
+    "meta": {
+        "title_cn": "{title}",
+        "one_liner": "一句话摘要",
+        "tags": {"contribution_type": "方法", "task_type": "推理", "is_llm": True, "is_safety_related": False},
+    },
+    "contribution": {
+        "problem_clear": {"answer": True, "note": "问题定义清晰"},
+        "is_repackaged": {"answer": False, "note": ""},
+        "comparison": {"related_works": ["Baseline A", "Baseline B"], "real_difference": "训练目标不同", "novelty_score": 3},
+    },
+    "methodology": {"pipeline": "data -> model -> eval", "key_assumptions": ["i.i.d. 数据"], "complexity": "O(n)"},
+    "limitations": {
+        "author_stated": [{"issue": "数据规模", "category": "数据"}],
+        "hidden_issues": {"fragile_assumptions": "分布偏移", "potential_hacks": "prompt 调优"},
+        "harm_risk": {"deployment_risk": "低", "who_might_be_harmed": "无"},
+        "anti_use_cases": ["不要在高风险决策中使用"],
+    },
+    "reproducibility": {
+        "code": {"status": "开源", "version_deps": True, "note": ""},
+        "data": {"status": "公开", "stats_provided": True},
+        "experiment": {"seed_provided": False, "variance_reported": False, "ablation_complete": True, "baseline_tuned": "不确定"},
+        "cost_estimate": {"gpu_hours": "100", "memory_requirement": "80GB", "human_level": "研究生"},
+    },
+    "verdict": {
+        "scores": {"novelty": 3, "engineering_value": 4, "scientific_rigor": 3, "reproducibility": 4, "weighted_total": "3.5"},
+        "recommendations": {"worth_reproducing": True, "worth_industry_trial": False, "worth_survey_inclusion": True},
+        "target_audience": "大模型研究者",
+        "key_takeaway": "简单的改动带来稳定收益",
+        "practical_lesson": "先做消融",
+    },
+}
+
+TEXT_TEMPLATE = "## {title}\n\n" + "\n".join(f"- 要点 {i}: 这是一段用于压测的占位内容。" for i in range(1, 13))
+
+_TITLE_RES = [re.compile(r"(?:Title|标题):\s*(.+)")]
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 800.0    # median time to first byte
+    sigma: float = 0.5           # lognormal shape; 0 = constant latency
+    ms_per_token: float = 0.0    # extra generation time per completion token
+    rate_429: float = 0.0
+    retry_after_s: float = 1.0
+    timeout_rate: float = 0.0
+    hang_s: float = 120.0
+    seed: int = 7
+    canned: Optional[str] = None  # JSON file overriding {"analyze_paper", "deep_dive", "text"}
+
+
+def _fill(template: Any, title: str) -> Any:
+    if isinstance(template, dict):
+        return {k: _fill(v, title) for k, v in template.items()}
+    if isinstance(template, list):
+        return [_fill(v, title) for v in template]
+    if isinstance(template, str):
+        return template.replace("{title}", title)
+    return template
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "LLMStubServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/__stats":
+            return self._json(200, self.server.stats())
+        self._json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._json(404, {"error": {"message": f"unknown endpoint {self.path}"}})
+
+        srv, cfg = self.server, self.server.cfg
+        with srv.lock:
+            srv.requests += 1
+            roll = srv.rng.random()
+            base = cfg.latency_ms * (math.exp(srv.rng.gauss(0, cfg.sigma)) if cfg.sigma else 1.0) / 1000.0
+
+        if roll < cfg.rate_429:
+            srv.count("rate_limited")
+            return self._json(429, {"error": {"message": "rate limited (stub)", "type": "rate_limit_error"}},
+                              {"Retry-After": str(cfg.retry_after_s)})
+        if roll < cfg.rate_429 + cfg.timeout_rate:
+            srv.count("hung")
+            time.sleep(cfg.hang_s)
+            return
+
+        content = srv.render(request)
+        completion_tokens = min(_estimate_tokens(content), int(request.get("max_tokens") or 4096))
+        prompt_tokens = sum(_estimate_tokens(m.get("content") or "") for m in request.get("messages", []))
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+        generation_s = completion_tokens * cfg.ms_per_token / 1000.0
+        srv.count("completed")
+
+        time.sleep(base)
+        if request.get("stream"):
+            return self._stream(request, content, usage, generation_s)
+        time.sleep(generation_s)
+        self._json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage,
+        })
+
+    def _stream(self, request: Dict[str, Any], content: str, usage: Dict[str, int], generation_s: float) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)] or [""]
+        delay = generation_s / len(pieces)
+
+        def event(delta: Dict[str, Any], finish: Optional[str] = None, **extra) -> None:
+            payload = {"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                       "model": request.get("model", "stub"),
+                       "choices": [{"index": 0, "delta": delta, "finish_reason": finish}], **extra}
+            self.wfile.write(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        event({"role": "assistant", "content": ""})
+        for piece in pieces:
+            if delay:
+                time.sleep(delay)
+            event({"content": piece})
+        event({}, "stop", usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class LLMStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, cfg: StubConfig, port: int = 0):
+        super().__init__(("127.0.0.1", port), StubHandler)
+        self.cfg = cfg
+        self.rng = random.Random(cfg.seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.outcomes: Dict[str, int] = {}
+        self.templates = {"analyze_paper": ANALYZE_TEMPLATE, "deep_dive": DEEP_DIVE_TEMPLATE, "text": TEXT_TEMPLATE}
+        if cfg.canned:
+            with open(cfg.canned, encoding="utf-8") as f:
+                self.templates.update(json.load(f))
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def count(self, outcome: str) -> None:
+        with self.lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"requests": self.requests, **self.outcomes}
+
+    def render(self, request: Dict[str, Any]) -> str:
+        prompt = "\n".join(m.get("content") or "" for m in request.get("messages", []))
+        title = next((m.group(1).strip() for r in _TITLE_RES for m in [r.search(prompt)] if m), "Untitled")
+        wants_json = (request.get("response_format") or {}).get("type") == "json_object"
+        if wants_json:
+            template = self.templates["deep_dive"] if "NeurIPS" in prompt else self.templates["analyze_paper"]
+            return json.dumps(_fill(template, title), ensure_ascii=False)
+        return _fill(self.templates["text"], title)
+
+
+def _serve(cfg: StubConfig, port_queue) -> None:
+    server = LLMStubServer(cfg)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+@contextlib.contextmanager
+def llm_stub_server(cfg: StubConfig) -> Iterator[str]:
+    """Runs the stub in a child process and yields its /v1 base URL."""
+    ctx = multiprocessing.get_context("spawn")
+    port_queue = ctx.Queue()
+    proc = ctx.Process(target=_serve, args=(cfg, port_queue), daemon=True)
+    proc.start()
+    try:
+        yield f"http://127.0.0.1:{port_queue.get(timeout=30)}/v1"
+    finally:
+        proc.terminate()
+        proc.join(5)
+
+
+def add_stub_args(parser: argparse.ArgumentParser) -> None:
+    defaults = StubConfig()
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--sigma", type=float, default=defaults.sigma)
+    parser.add_argument("--ms-per-token", type=float, default=defaults.ms_per_token)
+    parser.add_argument("--rate-429", type=float, default=defaults.rate_429)
+    parser.add_argument("--retry-after-s", type=float, default=defaults.retry_after_s)
+    parser.add_argument("--timeout-rate", type=float, default=defaults.timeout_rate)
+    parser.add_argument("--hang-s", type=float, default=defaults.hang_s)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--canned", default=None)
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency_ms=args.latency_ms, sigma=args.sigma, ms_per_token=args.ms_per_token, rate_429=args.rate_429,
+        retry_after_s=args.retry_after_s, timeout_rate=args.timeout_rate, hang_s=args.hang_s,
+        seed=args.seed, canned=args.canned,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8766)
+    add_stub_args(parser)
+    args = parser.parse_args()
+    server = LLMStubServer(config_from_args(args), args.port)
+    print(f"LLM stub on {server.base_url} ({json.dumps(asdict(server.cfg))})")
+    server.serve_forever()
@@ -1,58 +1,256 @@
 import arxiv
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 import logging
-from core.utils.config_loader import ConfigLoader
-from core.utils.code_signals import CodeSignals
+from core.utils.config_loader import ConfigLoader, ConfigSnapshot
+from core.utils.code_signals import CodeSignals, StarBatcher
+from core.utils.item_store import ItemStore, get_item_store
+from core.utils.tracing import span
+from core.utils import metrics
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HIGH_WATER_MARK_KEY = "arxiv_high_water_mark"
+
+# Safety cap on papers paged per incremental run while looking for the high-water mark
+MAX_BACKFILL = int(os.getenv("ARXIV_MAX_BACKFILL", "5000"))
+
+# Enrichment that saturates every code-signal cap in _process_paper (stars and likes
+# are each worth at most 100 points), i.e. the best score a paper could still reach
+_MAX_ENRICHMENT = {"stars": 1000, "likes": 500}
+
+
+class TopPapers:
+    """
+    Tells, while enrichment is still running, which papers are certain to end up in
+    the final top `n` by hype_score (ties keep ArXiv order) with at least `min_score`.
+    Papers not scored yet count with their best possible score.
+    """
+
+    def __init__(self, bounds: List[int], n: int, min_score: int = 0):
+        self.scores = list(bounds)
+        self.final = [False] * len(bounds)
+        self.emitted = set()
+        self.n = n
+        self.min_score = min_score
+
+    def scored(self, index: int, score: int) -> List[int]:
+        """Records a final score; returns the indices that just became certain."""
+        self.scores[index] = score
+        self.final[index] = True
+        certain = [i for i in range(len(self.scores))
+                   if self.final[i] and i not in self.emitted and self._certain(i)]
+        self.emitted.update(certain)
+        return certain
+
+    def _certain(self, i: int) -> bool:
+        s = self.scores[i]
+        if s < self.min_score:
+            return False
+        could_rank_above = sum(1 for j, t in enumerate(self.scores) if j != i and (t > s or (t == s and j < i)))
+        return could_rank_above < self.n
+
+
+def _submit_after(ready: Future, pool: Executor, fn: Callable[..., Any], *args) -> Future:
+    """Submits fn(*args) to `pool` once `ready` is done; the returned Future carries its result."""
+    out: Future = Future()
+
+    def relay(inner: Future) -> None:
+        if inner.exception() is not None:
+            out.set_exception(inner.exception())
+        else:
+            out.set_result(inner.result())
+
+    def submit(_: Future) -> None:
+        try:
+            pool.submit(fn, *args).add_done_callback(relay)
+        except RuntimeError as e:
+            # The pool was shut down before the batch came in
+            out.set_exception(e)
+
+    ready.add_done_callback(submit)
+    return out
+
+
 class ArxivMiner:
-    def __init__(self, config_loader: ConfigLoader):
+    def __init__(self, config_loader: ConfigLoader, enrich_workers: int = 8,
+                 store: Optional[ItemStore] = None, max_stored: int = 1000):
         self.config_loader = config_loader
         self.influencers = self.config_loader.load()
         self.client = arxiv.Client()
-        self.code_signals = CodeSignals()
+        self.code_signals = CodeSignals(pool_size=enrich_workers)
+        self.enrich_workers = enrich_workers
+
+        # Incremental harvesting: high-water mark + scored papers kept between runs
+        self.store = store
+        self.max_stored = max_stored
 
-    def fetch_latest_papers(self, max_results: int = 100) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        self.code_signals.close()
+
+    def fetch_latest_papers(self, max_results: int = 100, incremental: bool = False, top_n: int = 0,
+                            min_score: int = 0, on_top: Optional[Callable[[Dict[str, Any]], None]] = None
+                            ) -> List[Dict[str, Any]]:
         """
         Fetch papers from CS.CL, CS.CV, CS.LG from the last 7 days.
+        With incremental=True, paging continues past max_results until the newest
+        paper processed by the previous run (up to MAX_BACKFILL papers); only newer
+        papers are enriched and scored, then merged into the stored set, which is
+        what gets returned (published as ISO strings). max_results then only bounds
+        the first run. The mark moves only once it was actually reached, so a run
+        cut short by MAX_BACKFILL leaves the gap to the next one.
+        on_top(paper) is called, from this thread, for each paper of the final top
+        `top_n` (hype_score >= min_score) as soon as its place there is certain,
+        so callers can start on the best papers before the rest are scored.
+        It is not supported together with incremental=True.
         """
+        if on_top and incremental:
+            raise ValueError("on_top needs the full result set; it can't be combined with incremental=True")
+
         # Construct query for "Artificial Intelligence" related categories
         # cat:cs.CL OR cat:cs.AI OR cat:cs.CV OR cat:cs.LG
         search_query = 'cat:cs.CL OR cat:cs.AI OR cat:cs.CV OR cat:cs.LG'
         
+        # Watchlists and the keyword matcher are precompiled once per config change
+        snapshot = self.config_loader.snapshot()
+        mark = self._load_state() if incremental else None
+        limit = MAX_BACKFILL if mark else max_results
+        reached_mark = mark is None
+
         search = arxiv.Search(
             query=search_query,
-            max_results=max_results,
+            max_results=limit,
             sort_by=arxiv.SortCriterion.SubmittedDate,
             sort_order=arxiv.SortOrder.Descending
         )
 
-        papers = []
-        author_watchlist = set(a.lower() for a in self.config_loader.author_names)
-        org_watchlist = set(k.lower() for k in self.config_loader.org_names)
+        logger.info(f"Fetching max {limit} papers from ArXiv{' (down to the high-water mark)' if mark else ''}...")
 
-        logger.info(f"Fetching max {max_results} papers from ArXiv...")
-        
-        for result in self.client.results(search):
-            paper_data = self._process_paper(result, author_watchlist, org_watchlist)
-            papers.append(paper_data)
+        # Enrichment (GitHub / HF lookups) runs on a worker pool while ArXiv is
+        # still paging. GitHub links are grouped into GraphQL batches on a separate
+        # single worker; a paper with one is only submitted for enrichment once its
+        # batch is in, so no enrichment worker sits waiting on a batch.
+        pending = []
+        with ThreadPoolExecutor(max_workers=self.enrich_workers, thread_name_prefix="arxiv-enrich") as enrich_pool, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="arxiv-stars") as batch_pool:
+            batcher = StarBatcher(self.code_signals, batch_pool)
+
+            with span("arxiv.results", "fetch", max_results=max_results) as s:
+                for result in self.client.results(search):
+                    if mark and self._reached_mark(result, mark):
+                        logger.info(f"Reached high-water mark after {len(pending)} new papers")
+                        reached_mark = True
+                        break
+                    links = self.code_signals.extract_links(result.summary)
+                    batch_ready = batcher.add(links['github']) if 'github' in links else None
+                    if batch_ready is None:
+                        pending.append((result, enrich_pool.submit(self._enrich, links)))
+                    else:
+                        pending.append((result, _submit_after(batch_ready, enrich_pool, self._enrich, links)))
+                batcher.flush()
+                s.set(papers=len(pending))
+
+            # Scored in completion order; the final sort restores ArXiv order among ties
+            top = None
+            if on_top and top_n > 0:
+                top = TopPapers([self._score_bound(r, snapshot) for r, _ in pending], top_n, min_score)
+            index = {future: i for i, (_, future) in enumerate(pending)}
+            scored: List[Optional[Dict[str, Any]]] = [None] * len(pending)
+            for future in as_completed(index):
+                i = index[future]
+                with span("arxiv.score", "score"):
+                    scored[i] = self._process_paper(pending[i][0], snapshot, future.result())
+                if top is not None:
+                    for j in top.scored(i, scored[i]['hype_score']):
+                        on_top(scored[j])
+            papers = scored
+
+        if incremental:
+            if not reached_mark:
+                logger.warning(f"High-water mark not reached within {limit} papers; keeping it so the "
+                               f"next run fetches the rest")
+            papers = self._merge_and_save(papers, move_mark=reached_mark)
 
         # Sort by 'hype_score' descending
         papers.sort(key=lambda x: x['hype_score'], reverse=True)
+        metrics.MINER_ITEMS.inc(len(papers), miner="arxiv")
         return papers
 
-    def _process_paper(self, result: arxiv.Result, author_watchlist: set, org_watchlist: set) -> Dict[str, Any]:
+    def _score_bound(self, result: arxiv.Result, snapshot: ConfigSnapshot) -> int:
+        """Best hype_score the paper can still get, before its enrichment is known."""
+        links = self.code_signals.extract_links(result.summary)
+        return self._process_paper(result, snapshot, {"links": links, **_MAX_ENRICHMENT})['hype_score']
+
+    @staticmethod
+    def _reached_mark(result: arxiv.Result, mark: Dict[str, Any]) -> bool:
+        # Results come newest first; several papers can share the mark's timestamp
+        published = result.published.isoformat()
+        return published < mark['published'] or (published == mark['published'] and result.entry_id in mark['ids'])
+
+    def _get_store(self) -> ItemStore:
+        if self.store is None:
+            self.store = get_item_store()
+        return self.store
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        state = self._get_store().get_meta(HIGH_WATER_MARK_KEY)
+        if not state:
+            return None
+        return {"published": state["published"], "ids": set(state["ids"])}
+
+    def _merge_and_save(self, new_papers: List[Dict[str, Any]], move_mark: bool = True) -> List[Dict[str, Any]]:
+        """
+        Merges freshly scored papers into the stored set and, with move_mark, moves
+        the high-water mark to the newest stored paper.
+        """
+        for p in new_papers:
+            if hasattr(p.get('published'), 'isoformat'):
+                p['published'] = p['published'].isoformat()
+
+        store = self._get_store()
+        store.upsert_papers(new_papers)
+        papers = store.recent_papers(limit=self.max_stored)
+
+        if papers and move_mark:
+            newest = papers[0]['published']
+            store.set_meta(HIGH_WATER_MARK_KEY, {
+                "published": newest,
+                "ids": [p['url'] for p in papers if p['published'] == newest],
+            })
+        logger.info(f"Stored {len(new_papers)} new papers ({len(papers)} returned)")
+        return papers
+
+    def _enrich(self, links: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Network half of the scoring: GitHub stars and HF likes for the paper's links.
+        """
+        with span("arxiv.enrich", "enrich", links=len(links)):
+            return self._fetch_enrichment(links)
+
+    def _fetch_enrichment(self, links: Dict[str, str]) -> Dict[str, Any]:
+        enrichment = {"links": links}
+        if 'github' in links:
+            enrichment['stars'] = self.code_signals.get_github_stars(links['github'])
+        if 'hf' in links:
+            enrichment['likes'] = self.code_signals.get_hf_likes(links['hf'])
+        return enrichment
+
+    def _process_paper(self, result: arxiv.Result, snapshot: ConfigSnapshot,
+                       enrichment: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Convert arxiv result to dictionary and calculate Hype Score.
+        `enrichment` is the output of _enrich(); it is fetched inline when missing.
         """
         authors = [a.name for a in result.authors]
         title = result.title
         abstract = result.summary
-        full_text = (title + " " + abstract).lower()
+        full_text = title + " " + abstract
+        # Orgs and channel keywords are matched in a single pass
+        hits = snapshot.matcher.find(full_text, {"org", "channel"})
         
         # --- SCORING LOGIC ---
         hype_score = 0
@@ -60,21 +258,22 @@ class ArxivMiner:
 
         # 1. Check Authors
         for author in authors:
-            if author.lower() in author_watchlist:
+            if author.lower() in snapshot.author_names:
                 hype_score += 100 # MASSIVE BOOST
                 signals.append(f"Star Author: {author}")
         
         # 2. Check Org Keywords
-        for org in org_watchlist:
-            if org in full_text:
-                hype_score += 50
-                signals.append(f"Org Mention: {org}")
+        for org in dict.fromkeys(h.label for h in hits if h.category == "org"):
+            hype_score += 50
+            signals.append(f"Org Mention: {org}")
 
         # 3. Check Code Signals (GitHub & HuggingFace)
-        links = self.code_signals.extract_links(abstract)  # Note: ArXiv API abstracts often contain links
+        if enrichment is None:
+            enrichment = self._enrich(self.code_signals.extract_links(abstract))  # Note: ArXiv API abstracts often contain links
+        links = enrichment['links']
         
         if 'github' in links:
-            stars = self.code_signals.get_github_stars(links['github'])
+            stars = enrichment['stars']
             if stars > 0:
                 # Score formula: 1 point per 10 stars, max 50 points cap for pure stars (to balance author weight)
                 star_points = min(int(stars / 10), 100)
@@ -86,7 +285,7 @@ class ArxivMiner:
                 signals.append("Code Available")
 
         if 'hf' in links:
-            likes = self.code_signals.get_hf_likes(links['hf'])
+            likes = enrichment['likes']
             if likes > 0:
                 # HF likes are valuable. 1 point per 5 likes.
                 like_points = min(int(likes / 5), 100)
@@ -94,13 +293,8 @@ class ArxivMiner:
                 signals.append(f"HF Likes: {likes} (+{like_points})")
 
         # 4. Check Radar Channels
-        active_channels = []
-        channels = self.config_loader.load_channels()
-        for ch in channels:
-            for kw in ch.keywords:
-                if kw.lower() in full_text:
-                    active_channels.append(ch.name)
-                    break # Matched this channel, move to next channel
+        matched_channels = set(h.label for h in hits if h.category == "channel")
+        active_channels = [name for name in snapshot.channel_names if name in matched_channels]
         
         if active_channels:
              signals.append(f"Channels: {', '.join(active_channels)}")
@@ -1,7 +1,9 @@
-import feedparser
 import logging
 from typing import List, Dict, Any
 from core.utils.config_loader import ConfigLoader
+from core.utils.feed_fetcher import get_feed_fetcher
+from core.utils.keyword_matcher import KeywordMatcher
+from core.utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +12,7 @@ class InterviewMiner:
         logging.basicConfig(level=logging.INFO)
         self.config_loader = config_loader
         self.config = self.config_loader.load()
+        self.matcher = KeywordMatcher.from_config(self.config_loader)
         
     def fetch_interviews(self, max_items_per_feed: int = 20) -> List[Dict[str, Any]]:
         """
@@ -19,7 +22,7 @@ class InterviewMiner:
         
         # 1. Build Watchlist
         # We look for names like "Sam Altman", "Ilya", "Kaiming He"
-        watchlist = set(a.name.lower() for a in self.config.authors)
+        watchlist = [a.name for a in self.config.authors]
         # Also include Org names? Maybe less relevant for interviews, but "DeepMind CEO" is good.
         # Let's stick to Authors for "Big Talk" focus.
         
@@ -29,11 +32,12 @@ class InterviewMiner:
             logger.warning("No interview_sources found in config.")
             return []
 
-        # 2. Scan Feeds
+        # 2. Scan Feeds (downloaded concurrently)
+        feeds = get_feed_fetcher().fetch_many(s.url for s in self.config.interview_sources)
+
         for source in self.config.interview_sources:
             try:
-                # logger.info(f"Checking {source.name}...")
-                feed = feedparser.parse(source.url)
+                feed = feeds[source.url]
                 
                 if not feed.entries:
                     continue
@@ -41,18 +45,12 @@ class InterviewMiner:
                 for entry in feed.entries[:max_items_per_feed]:
                     title = entry.title
                     summary = entry.get('summary', '') or entry.get('description', '')
-                    full_text = (title + " " + summary).lower()
+                    full_text = title + " " + summary
                     
                     # 3. Match Logic
-                    detected_names = []
-                    for name in watchlist:
-                        # Simple substring match. 
-                        # "Sam Altman" in "Sam Altman Interview" -> Match
-                        # "Ilya" in "Ilya Sutskever" -> Match
-                        # Split name to handle partials? No, full name is safer to avoid false positives.
-                        # But user config has full names.
-                        if name in full_text:
-                            detected_names.append(name)
+                    # Full names only ("Sam Altman" in "Sam Altman Interview" -> Match);
+                    # partial names would cause too many false positives.
+                    detected_names = self.matcher.labels(full_text, "author")
                             
                     if detected_names:
                         # Found a match!
@@ -67,6 +65,7 @@ class InterviewMiner:
             except Exception as e:
                 logger.error(f"Error checking {source.name}: {e}")
                 
+        metrics.MINER_ITEMS.inc(len(matches), miner="interview")
         return matches
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
-import feedparser
 import logging
 from typing import List, Dict, Any
 from core.utils.config_loader import ConfigLoader
+from core.utils.feed_fetcher import get_feed_fetcher
+from core.utils.dedup import get_dedup_index
+from core.utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -56,11 +58,13 @@ class NewsMiner:
         target_feeds = self.feeds[category]
         
         logger.info(f"Fetching RSS feeds for category: {category}...")
+
+        # All feeds of the category are downloaded concurrently (with timeouts)
+        feeds = get_feed_fetcher().fetch_many(target_feeds.values())
         
         for source_name, url in target_feeds.items():
             try:
-                # Set specific timeout to avoid hanging
-                feed = feedparser.parse(url)
+                feed = feeds[url]
                 if not feed.entries:
                     continue
                 
@@ -78,9 +82,14 @@ class NewsMiner:
             except Exception as e:
                 logger.error(f"Error fetching {source_name}: {e}")
                 
+        # The same announcement often comes through several feeds; keep one copy
+        news_items = get_dedup_index().dedupe(news_items)
+
         # Sort by somewhat recent if possible, otherwise just return list
         # We could parse dates but for MVP just shuffling/listing is fine.
-        return news_items[:max_items]
+        news_items = news_items[:max_items]
+        metrics.MINER_ITEMS.inc(len(news_items), miner=f"news.{category}")
+        return news_items
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
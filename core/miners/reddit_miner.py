@@ -1,8 +1,10 @@
 import feedparser
 import logging
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from core.utils.config_loader import ConfigLoader
+from core.utils.feed_fetcher import get_feed_fetcher
+from core.utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +21,25 @@ class RedditMiner:
             logger.warning("No social_sources found in config.")
             return []
 
+        # Universal RSS Fetching (Works for Reddit .rss and HN rss), all sources at once
+        feeds = get_feed_fetcher().fetch_many(s.url for s in self.config.social_sources)
+
         for source in self.config.social_sources:
             try:
-                # Universal RSS Fetching (Works for Reddit .rss and HN rss)
-                posts.extend(self._fetch_rss(source))
+                posts.extend(self._fetch_rss(source, feeds.get(source.url)))
             except Exception as e:
                 logger.error(f"Error fetching {source.name}: {e}")
                 
-        return posts[:max_items * len(self.config.social_sources)] 
+        posts = posts[:max_items * len(self.config.social_sources)]
+        metrics.MINER_ITEMS.inc(len(posts), miner="reddit")
+        return posts
 
-    def _fetch_rss(self, source) -> List[Dict[str, Any]]:
+    def _fetch_rss(self, source, feed: Optional[feedparser.FeedParserDict] = None) -> List[Dict[str, Any]]:
         items = []
         try:
-           # feedparser handles HTTP requests internally
-           logger.info(f"Fetching RSS: {source.name}...")
-           feed = feedparser.parse(source.url)
+           if feed is None:
+               logger.info(f"Fetching RSS: {source.name}...")
+               feed = get_feed_fetcher().fetch(source.url)
            
            if feed.bozo and feed.bozo_exception:
                logger.warning(f"Feed error for {source.name}: {feed.bozo_exception}")
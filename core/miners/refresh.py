@@ -0,0 +1,91 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from core.miners.arxiv_miner import ArxivMiner
+from core.miners.section_feeds import (DEDUP_SECTIONS, dedupe_sections, fetch_all_news, fetch_discourse,
+                                      fetch_podcasts, fetch_products)
+from core.utils.config_loader import ConfigLoader
+from core.utils.item_store import ItemStore, get_item_store
+from core.utils.scheduler import lease_name, single_flight
+
+logger = logging.getLogger(__name__)
+
+# Score cut-off for the Research page list
+MIN_HYPE_SCORE = 20
+
+# Serialises the read-dedupe-write of DEDUP_SECTIONS snapshots within the process
+_dedup_lock = threading.Lock()
+
+# One miner per process, so its pooled sessions and signal cache outlive a single refresh
+_miner: Optional[ArxivMiner] = None
+_miner_lock = threading.Lock()
+
+
+def _get_miner(config: ConfigLoader, store: ItemStore) -> ArxivMiner:
+    global _miner
+    with _miner_lock:
+        if _miner is None or _miner.config_loader is not config or _miner.store is not store:
+            if _miner is not None:
+                _miner.close()
+            _miner = ArxivMiner(config, store=store)
+        return _miner
+
+
+def _papers(config: ConfigLoader, store: ItemStore) -> List[Dict[str, Any]]:
+    # Only papers newer than the last scan are scored; older ones come from the store
+    papers = _get_miner(config, store).fetch_latest_papers(max_results=80, incremental=True)
+    top_papers = [p for p in papers if p['hype_score'] >= MIN_HYPE_SCORE]
+    for p in top_papers:
+        if hasattr(p.get('published'), 'isoformat'):
+            p['published'] = p['published'].isoformat()
+    return top_papers
+
+
+# Store section -> fetcher. Each refresh saves one new batch: the snapshot the pages read.
+FETCHERS: Dict[str, Callable[[ConfigLoader, ItemStore], List[Dict[str, Any]]]] = {
+    "papers": _papers,
+    "news": lambda config, store: fetch_all_news(config, max_per_source=8),
+    "products": lambda config, store: fetch_products(config),
+    "discourse": lambda config, store: fetch_discourse(config),
+    "podcasts": lambda config, store: fetch_podcasts(config),
+}
+
+
+def refresh(section: str, config: Optional[ConfigLoader] = None, store: Optional[ItemStore] = None) -> int:
+    """Fetches one section and saves it as a new batch; returns the item count."""
+    config = config or ConfigLoader()
+    store = store or get_item_store()
+    items = FETCHERS[section](config, store)
+    if section == "papers":
+        store.save_papers_batch(items)
+    elif section in DEDUP_SECTIONS:
+        items = _save_deduped(section, items, store)
+    else:
+        store.save_feed_batch(section, items)
+    logger.info(f"Refreshed {section}: {len(items)} items")
+    return len(items)
+
+
+def _save_deduped(section: str, items: List[Dict[str, Any]], store: ItemStore) -> List[Dict[str, Any]]:
+    """
+    Dedupes fresh items together with the stored snapshots of the other
+    DEDUP_SECTIONS, saves the fresh section, and re-saves any other section whose
+    snapshot changed (a copy moved out, or gained a duplicate).
+    """
+    with _dedup_lock:
+        stored = {s: store.latest_feed_items(s) for s in DEDUP_SECTIONS if s != section}
+        deduped = dedupe_sections({**stored, section: items})
+        for name, rows in stored.items():
+            if deduped[name] != rows:
+                store.save_feed_batch(name, deduped[name])
+        store.save_feed_batch(section, deduped[section])
+    return deduped[section]
+
+
+def refresh_now(section: str, config: Optional[ConfigLoader] = None, store: Optional[ItemStore] = None) -> Optional[int]:
+    """
+    refresh() for manual triggers (page buttons). Returns None without fetching
+    when the scheduler or another session is already refreshing this section.
+    """
+    with single_flight(lease_name(section)) as acquired:
+        return refresh(section, config, store) if acquired else None
@@ -1,7 +1,9 @@
-import feedparser
 import logging
 from typing import List, Dict, Any
 from core.utils.config_loader import ConfigLoader
+from core.utils.feed_fetcher import get_feed_fetcher
+from core.utils.keyword_matcher import KeywordMatcher
+from core.utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,7 @@ class SafetyMiner:
             "safety", "alignment", "risk", "red team", "preparedness", 
             "superalignment", "policy", "societal", "governance", "audit"
         ]
+        self.matcher = KeywordMatcher.from_config(config_loader, extra={"safety": self.safety_keywords})
         
     def fetch_safety_reports(self, max_items: int = 10) -> List[Dict[str, Any]]:
         reports = []
@@ -21,15 +24,16 @@ class SafetyMiner:
             logger.warning("No safety_sources found in config.")
             return []
 
+        feeds = get_feed_fetcher().fetch_many(s.url for s in self.config.safety_sources)
+
         for source in self.config.safety_sources:
             try:
-                # logger.info(f"Scanning Safety Source: {source.name}...")
-                feed = feedparser.parse(source.url)
+                feed = feeds[source.url]
                 
                 for entry in feed.entries[:max_items]:
                     title = entry.title
                     summary = entry.get('summary', '') or entry.get('description', '')
-                    full_text = (title + " " + summary).lower()
+                    full_text = title + " " + summary
                     
                     # Filtering Logic
                     # If it's a dedicated source (Alignment Forum), keep everything.
@@ -38,7 +42,7 @@ class SafetyMiner:
                     
                     if not is_dedicated:
                         # Check keywords
-                        if not any(k in full_text for k in self.safety_keywords):
+                        if not self.matcher.has_any(full_text, "safety"):
                             continue
 
                     reports.append({
@@ -51,6 +55,7 @@ class SafetyMiner:
             except Exception as e:
                 logger.error(f"Error checking {source.name}: {e}")
                 
+        metrics.MINER_ITEMS.inc(len(reports), miner="safety")
         return reports
 
 if __name__ == "__main__":
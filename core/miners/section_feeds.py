@@ -0,0 +1,125 @@
+import logging
+from typing import List, Dict, Any
+from core.utils.config_loader import ConfigLoader
+from core.utils.feed_fetcher import get_feed_fetcher
+from core.utils.keyword_matcher import KeywordMatcher
+from core.utils.dedup import get_dedup_index
+from core.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# Fetch helpers behind the News / Products / Discourse / Podcasts pages.
+# They live outside the Streamlit pages so batch jobs and benchmarks can call them.
+# They return raw items; dedupe_sections() collapses copies across sections.
+
+# Sections deduped in one pass. A story found in several keeps its place in the
+# earliest one (an announcement beats its HN thread) and lists the others as duplicates.
+DEDUP_SECTIONS = ("news", "products", "discourse")
+
+
+def _emit(section: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    metrics.MINER_ITEMS.inc(len(items), miner=section)
+    return items
+
+
+def dedupe_sections(sections: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """One near-duplicate pass over the DEDUP_SECTIONS present in `sections`; other sections pass through."""
+    names = [s for s in DEDUP_SECTIONS if s in sections]
+    deduped = get_dedup_index().dedupe_groups([sections[s] for s in names])
+    return {**sections, **dict(zip(names, deduped))}
+
+
+def fetch_all_news(config: ConfigLoader, max_per_source: int = 5) -> List[Dict[str, Any]]:
+    cfg = config.load()
+    all_news = []
+    parsed_feeds = get_feed_fetcher().fetch_many(f.url for f in cfg.news_feeds)
+    for feed in cfg.news_feeds:
+        try:
+            parsed = parsed_feeds[feed.url]
+            for entry in parsed.entries[:max_per_source]:
+                all_news.append({
+                    "source": feed.name,
+                    "type": feed.type or "unknown",
+                    "title": entry.title,
+                    "url": entry.link,
+                    "published": entry.get('published', 'N/A'),
+                    "summary": (entry.get('summary', '') or entry.get('description', ''))[:250] + "..."
+                })
+        except Exception as e:
+            logger.warning(f"Could not fetch {feed.name}: {e}")
+    return _emit("page_news", all_news)
+
+
+def fetch_products(config: ConfigLoader, max_per_source: int = 10) -> List[Dict[str, Any]]:
+    cfg = config.load()
+    products = []
+    parsed_feeds = get_feed_fetcher().fetch_many(f.url for f in cfg.product_sources)
+    for feed in cfg.product_sources:
+        try:
+            parsed = parsed_feeds[feed.url]
+            for entry in parsed.entries[:max_per_source]:
+                products.append({
+                    "source": feed.name,
+                    "title": entry.title,
+                    "url": entry.link,
+                    "published": entry.get('published', 'N/A'),
+                    "summary": (entry.get('summary', '') or entry.get('description', ''))[:200] + "..."
+                })
+        except Exception as e:
+            logger.warning(f"Could not fetch {feed.name}: {e}")
+    return _emit("page_products", products)
+
+
+def fetch_discourse(config: ConfigLoader, max_per_source: int = 8) -> List[Dict[str, Any]]:
+    cfg = config.load()
+    posts = []
+    parsed_feeds = get_feed_fetcher().fetch_many(f.url for f in cfg.discourse_sources)
+    for feed in cfg.discourse_sources:
+        try:
+            parsed = parsed_feeds[feed.url]
+            for entry in parsed.entries[:max_per_source]:
+                posts.append({
+                    "source": feed.name,
+                    "type": feed.type or "unknown",
+                    "title": entry.title,
+                    "url": entry.link,
+                    "published": entry.get('published', 'N/A'),
+                    "summary": (entry.get('summary', '') or entry.get('description', ''))[:250] + "..."
+                })
+        except Exception as e:
+            pass # Silent fail for individual feeds
+    return _emit("page_discourse", posts)
+
+
+def fetch_podcasts(config: ConfigLoader, max_per_source: int = 5) -> List[Dict[str, Any]]:
+    cfg = config.load()
+    matcher = KeywordMatcher.from_config(config)
+    episodes = []
+
+    parsed_feeds = get_feed_fetcher().fetch_many(f.url for f in cfg.podcast_sources)
+    for feed in cfg.podcast_sources:
+        try:
+            parsed = parsed_feeds[feed.url]
+            for entry in parsed.entries[:max_per_source]:
+                title = entry.title
+                summary = entry.get('summary', '') or entry.get('description', '')
+                full_text = title + " " + summary
+
+                # Check for guest matches
+                detected_guests = matcher.labels(full_text, "author")
+
+                episodes.append({
+                    "source": feed.name,
+                    "title": title,
+                    "url": entry.link,
+                    "published": entry.get('published', 'N/A'),
+                    "summary": summary[:200] + "...",
+                    "guests": detected_guests,
+                    "has_vip": len(detected_guests) > 0
+                })
+        except Exception as e:
+            pass
+
+    # Sort: VIP guests first
+    episodes.sort(key=lambda x: x['has_vip'], reverse=True)
+    return _emit("page_podcasts", episodes)
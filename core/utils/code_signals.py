@@ -2,17 +2,77 @@ import re
 import requests
 import os
 import logging
-from typing import Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Dict, Iterable, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from core.utils.signal_cache import SignalCache
+from core.utils.tracing import span
+from core.utils import metrics
 
 logger = logging.getLogger(__name__)
 
+SIGNAL_REQUESTS = metrics.counter(
+    "radar_code_signal_requests_total", "GitHub / Hugging Face API calls by service and HTTP status", ["service", "status"]
+)
+SIGNAL_SECONDS = metrics.histogram("radar_code_signal_seconds", "GitHub / Hugging Face API latency", ["service"])
+
+def _pooled_session(pool_size: int, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Keep-alive session with a sized connection pool and retry/backoff on
+    transient failures (429 / 5xx, honouring Retry-After).
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+# GitHub caps GraphQL queries by node count; 100 aliased repositories is well within it
+GRAPHQL_BATCH_SIZE = 100
+
+_UNSET = object()
+
 class CodeSignals:
-    def __init__(self):
+    def __init__(self, pool_size: int = 8, cache: Optional[SignalCache] = None, use_cache: bool = True,
+                 github_api_url: Optional[str] = None):
+        # Overridable so the lookups can run against a local stub server
+        self.github_api_url = (github_api_url or os.getenv("GITHUB_API_URL", "https://api.github.com")).rstrip('/')
         self.github_token = os.getenv("GITHUB_TOKEN")
         self.headers = {"Accept": "application/vnd.github.v3+json"}
         if self.github_token:
             self.headers["Authorization"] = f"token {self.github_token}"
 
+        # One warm connection pool per API host, reused across every paper
+        self.github_session = _pooled_session(pool_size, self.headers)
+        self.hf_session = _pooled_session(pool_size)
+
+        # Star / like counts are shared across runs (see SignalCache for TTLs)
+        self._owns_cache = cache is None and use_cache
+        self.cache = cache if cache is not None else (SignalCache() if use_cache else None)
+        # Counts resolved by prefetch_github_stars(), each handed out once by _cached();
+        # repeat lookups go through the TTL cache like everything else
+        self._prefetched: Dict[str, Optional[int]] = {}
+
+    def close(self) -> None:
+        """Closes the connection pools, and the cache if this instance opened it."""
+        self.github_session.close()
+        self.hf_session.close()
+        if self._owns_cache:
+            self.cache.close()
+
     def extract_links(self, text: str) -> Dict[str, str]:
         """
         Extracts first GitHub and HuggingFace links found in text.
@@ -33,29 +93,167 @@ class CodeSignals:
             
         return links
 
+    @staticmethod
+    def _github_repo(url: str) -> Optional[Tuple[str, str]]:
+        """
+        Extract (owner, repo) from https://github.com/owner/repo
+        """
+        parts = url.rstrip('/').split('/')
+        if len(parts) < 2:
+            return None
+        owner, repo = parts[-2], parts[-1].rstrip('.')
+        if repo.endswith('.git'):
+            repo = repo[:-4]
+        return owner, repo
+
+    def _cached(self, key: str) -> Tuple[bool, int]:
+        prefetched = self._prefetched.pop(key, _UNSET)
+        if prefetched is not _UNSET:
+            metrics.CACHE_LOOKUPS.inc(cache="code_signals", result="hit")
+            return True, prefetched or 0
+        if not self.cache:
+            return False, 0
+        hit, value = self.cache.get(key)
+        metrics.CACHE_LOOKUPS.inc(cache="code_signals", result="hit" if hit else "miss")
+        return hit, value or 0
+
+    @staticmethod
+    def _call(service: str, session: requests.Session, method: str, url: str,
+              trace_args: Optional[Dict[str, object]] = None, **kwargs) -> requests.Response:
+        """One API round trip, traced and counted under `service` (github.stars, hf.likes...)."""
+        start = time.perf_counter()
+        with span(service, "enrich", **(trace_args or {})) as s:
+            try:
+                resp = session.request(method, url, **kwargs)
+            except Exception:
+                SIGNAL_REQUESTS.inc(service=service, status="error")
+                raise
+            finally:
+                SIGNAL_SECONDS.observe(time.perf_counter() - start, service=service)
+            s.set(status=resp.status_code, bytes=len(resp.content))
+        SIGNAL_REQUESTS.inc(service=service, status=resp.status_code)
+        metrics.DOWNLOAD_BYTES.inc(len(resp.content), source=urlparse(url).netloc)
+        return resp
+
+    def _remember(self, key: str, value: Optional[int]) -> None:
+        if self.cache:
+            self.cache.set(key, value)
+
+    def prefetch_github_stars(self, urls: Iterable[str], batch_size: int = GRAPHQL_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Resolves star counts for a whole batch of repos with aliased GraphQL queries
+        (up to `batch_size` repositories per round trip). The next get_github_stars()
+        call for each of these repos is answered from memory, later ones from the cache.
+        Repos that could not be resolved (no token, GraphQL error) are left to the REST path.
+        Returns: {'owner/repo': stars} for the repos resolved or already cached.
+        """
+        pending: Dict[str, Tuple[str, str]] = {}
+        resolved: Dict[str, int] = {}
+        for url in urls:
+            repo_id = self._github_repo(url)
+            if not repo_id:
+                continue
+            key = f"github:{repo_id[0]}/{repo_id[1]}".lower()
+            if key in pending or key in resolved:
+                continue
+            prefetched = self._prefetched.get(key, _UNSET)
+            if prefetched is not _UNSET:
+                # Prefetched by an earlier batch and not read yet; leave it for its reader
+                resolved[key] = prefetched or 0
+                continue
+            hit, stars = self._cached(key)
+            if hit:
+                resolved[key] = stars
+            else:
+                pending[key] = repo_id
+
+        if not pending:
+            return {k.split(':', 1)[1]: v for k, v in resolved.items()}
+
+        if not self.github_token:
+            # The GraphQL API does not allow anonymous access
+            logger.info(f"No GITHUB_TOKEN, {len(pending)} repos will use the REST API")
+            return {k.split(':', 1)[1]: v for k, v in resolved.items()}
+
+        keys = list(pending)
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start:start + batch_size]
+            stars_by_key = self._graphql_stars([pending[k] for k in batch])
+            if stars_by_key is None:
+                continue
+            for key, stars in zip(batch, stars_by_key):
+                self._prefetched[key] = stars
+                self._remember(key, stars)
+                if stars is not None:
+                    resolved[key] = stars
+
+        return {k.split(':', 1)[1]: v for k, v in resolved.items()}
+
+    def _graphql_stars(self, repos: List[Tuple[str, str]]) -> Optional[List[Optional[int]]]:
+        """
+        One GraphQL round trip for up to GRAPHQL_BATCH_SIZE repos.
+        Returns stars per repo (None = not found), or None if the whole query failed.
+        """
+        params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(len(repos)))
+        fields = " ".join(
+            f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ stargazerCount }}" for i in range(len(repos))
+        )
+        variables = {}
+        for i, (owner, name) in enumerate(repos):
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+
+        try:
+            resp = self._call(
+                "github.graphql", self.github_session, "POST", f"{self.github_api_url}/graphql",
+                json={"query": f"query({params}) {{ {fields} }}", "variables": variables},
+                timeout=15, trace_args={"repos": len(repos)},
+            )
+            if resp.status_code != 200:
+                logger.warning(f"GitHub GraphQL returned {resp.status_code}, falling back to REST")
+                return None
+            payload = resp.json()
+        except Exception as e:
+            logger.warning(f"GitHub GraphQL lookup failed, falling back to REST: {e}")
+            return None
+
+        data = payload.get('data') or {}
+        if not data and payload.get('errors'):
+            logger.warning(f"GitHub GraphQL errors: {payload['errors'][:1]}")
+            return None
+
+        # Missing / private repos come back as null nodes with NOT_FOUND errors
+        return [(data.get(f"r{i}") or {}).get('stargazerCount') for i in range(len(repos))]
+
     def get_github_stars(self, url: str) -> int:
         """
         Fetches numbers of stars for a GitHub repo.
         """
         try:
-            # Extract owner/repo from URL
-            # https://github.com/owner/repo
-            parts = url.rstrip('/').split('/')
-            if len(parts) < 2: 
+            repo_id = self._github_repo(url)
+            if not repo_id:
                 return 0
-            owner, repo = parts[-2], parts[-1]
+            owner, repo = repo_id
+
+            key = f"github:{owner}/{repo}".lower()
+            hit, stars = self._cached(key)
+            if hit:
+                return stars
             
-            api_url = f"https://api.github.com/repos/{owner}/{repo}"
-            resp = requests.get(api_url, headers=self.headers, timeout=5)
+            api_url = f"{self.github_api_url}/repos/{owner}/{repo}"
+            resp = self._call("github.stars", self.github_session, "GET", api_url, timeout=5,
+                              trace_args={"repo": f"{owner}/{repo}"})
             
             if resp.status_code == 200:
                 data = resp.json()
-                return data.get('stargazers_count', 0)
+                stars = data.get('stargazers_count', 0)
+                self._remember(key, stars)
+                return stars
             elif resp.status_code == 403:
                 logger.warning("GitHub API Rate Limit Exceeded")
             elif resp.status_code == 404:
                 # Repo might be private or deleted
-                pass
+                self._remember(key, None)
         except Exception as e:
             logger.warning(f"Failed to fetch GitHub stars: {e}")
             
@@ -79,12 +277,24 @@ class CodeSignals:
             
             # Try model endpoint
             object_id = "/".join(parts[-2:]) # Org/Name
+
+            key = f"hf:{object_id}".lower()
+            hit, likes = self._cached(key)
+            if hit:
+                return likes
+
             api_url = f"https://huggingface.co/api/models/{object_id}"
             
-            resp = requests.get(api_url, timeout=5)
+            resp = self._call("hf.likes", self.hf_session, "GET", api_url, timeout=5,
+                              trace_args={"model": object_id})
             if resp.status_code == 200:
                 data = resp.json()
-                return data.get('likes', 0)
+                likes = data.get('likes', 0)
+                self._remember(key, likes)
+                return likes
+            elif resp.status_code in (401, 404):
+                # HF answers 401 for unknown or gated repos
+                self._remember(key, None)
             
             # TODO: try /datasets/ or /spaces/ if needed, but models are primary target
             
@@ -92,3 +302,54 @@ class CodeSignals:
             logger.warning(f"Failed to fetch HF likes: {e}")
             
         return 0
+
+
+class StarBatcher:
+    """
+    Groups GitHub links that arrive one at a time (e.g. while ArXiv results are
+    still streaming) into GraphQL-sized batches.
+    add() returns a Future that completes once the link's batch has been prefetched,
+    or None when there is nothing to wait for (no token: REST only). A partial batch
+    is sent after `max_delay` seconds, so it never waits on a slow producer.
+    """
+
+    def __init__(self, signals: CodeSignals, executor: Executor, batch_size: int = GRAPHQL_BATCH_SIZE,
+                 max_delay: float = 0.5):
+        self.signals = signals
+        self.executor = executor
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._urls: List[str] = []
+        self._ready: Optional[Future] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, url: str) -> Optional[Future]:
+        if not self.signals.github_token:
+            return None
+        with self._lock:
+            if self._ready is None:
+                self._ready = Future()
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            self._urls.append(url)
+            ready, full = self._ready, len(self._urls) >= self.batch_size
+        if full:
+            self.flush()
+        return ready
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._urls:
+                return
+            urls, ready, timer = self._urls, self._ready, self._timer
+            self._urls, self._ready, self._timer = [], None, None
+        timer.cancel()
+        self.executor.submit(self._prefetch, urls, ready)
+
+    def _prefetch(self, urls: List[str], ready: Future) -> None:
+        try:
+            self.signals.prefetch_github_stars(urls, batch_size=self.batch_size)
+        finally:
+            ready.set_result(None)
@@ -1,33 +1,99 @@
 import yaml
+import hashlib
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, FrozenSet, Mapping, Tuple
+from pydantic import BaseModel, ConfigDict
+from core.utils.keyword_matcher import KeywordMatcher
 
-class AuthorConfig(BaseModel):
+class _Frozen(BaseModel):
+    # Snapshots are shared by every ConfigLoader in the process, so nothing in them may change
+    model_config = ConfigDict(frozen=True)
+
+class AuthorConfig(_Frozen):
     name: str
     weight: int
 
-class OrgConfig(BaseModel):
+class OrgConfig(_Frozen):
     name: str
     weight: int
 
-class FeedConfig(BaseModel):
+class FeedConfig(_Frozen):
     name: str
     url: str
     type: Optional[str] = None # e.g. "official", "media", "reddit", "forum"
 
-class ChannelConfig(BaseModel):
+class ChannelConfig(_Frozen):
     name: str
     description: str
-    keywords: List[str]
+    keywords: Tuple[str, ...]
+
+class InfluencerConfig(_Frozen):
+    authors: Tuple[AuthorConfig, ...] = ()
+    organizations: Tuple[OrgConfig, ...] = ()
+    news_feeds: Tuple[FeedConfig, ...] = ()
+    product_sources: Tuple[FeedConfig, ...] = ()
+    discourse_sources: Tuple[FeedConfig, ...] = ()
+    podcast_sources: Tuple[FeedConfig, ...] = ()
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable, precompiled view of the YAML config (frozen models, tuples and a
+    read-only feed_urls mapping).
+    Shared by every ConfigLoader in the process and rebuilt only when a file changes.
+    """
+    config: InfluencerConfig
+    channels: Tuple[ChannelConfig, ...]
+    author_names: FrozenSet[str]      # lowercased
+    org_names: FrozenSet[str]         # lowercased
+    channel_names: Tuple[str, ...]
+    matcher: KeywordMatcher           # authors + orgs + channel keywords
+    feed_urls: Mapping[str, Tuple[str, ...]]  # section -> URLs, e.g. "news_feeds"
+    digest: str                       # content hash of the YAML files
+
+CONFIG_FILES = ("influencers.yaml", "channels.yaml")
+FEED_SECTIONS = ("news_feeds", "product_sources", "discourse_sources", "podcast_sources")
+
+# config_dir -> (file stats, snapshot)
+_snapshots: Dict[Path, Tuple[tuple, ConfigSnapshot]] = {}
+_snapshot_lock = threading.Lock()
+
+def _read_yaml(path: Path) -> Tuple[Optional[Any], bytes]:
+    if not path.exists():
+        return None, b""
+    raw = path.read_bytes()
+    return yaml.safe_load(raw), raw
 
-class InfluencerConfig(BaseModel):
-    authors: List[AuthorConfig] = []
-    organizations: List[OrgConfig] = []
-    news_feeds: List[FeedConfig] = []
-    product_sources: List[FeedConfig] = []
-    discourse_sources: List[FeedConfig] = []
-    podcast_sources: List[FeedConfig] = []
+def _build_snapshot(config_dir: Path) -> ConfigSnapshot:
+    influencer_data, influencer_raw = _read_yaml(config_dir / "influencers.yaml")
+    channel_data, channel_raw = _read_yaml(config_dir / "channels.yaml")
+
+    config = InfluencerConfig(**influencer_data) if influencer_data else InfluencerConfig()
+    channels = tuple(ChannelConfig(**c) for c in channel_data['channels']) if channel_data and 'channels' in channel_data else ()
+
+    return ConfigSnapshot(
+        config=config,
+        channels=channels,
+        author_names=frozenset(a.name.lower() for a in config.authors),
+        org_names=frozenset(o.name.lower() for o in config.organizations),
+        channel_names=tuple(c.name for c in channels),
+        matcher=KeywordMatcher.from_watchlists(config, channels),
+        feed_urls=MappingProxyType({section: tuple(f.url for f in getattr(config, section)) for section in FEED_SECTIONS}),
+        digest=hashlib.sha1(influencer_raw + b"\0" + channel_raw).hexdigest(),
+    )
+
+def _file_stats(config_dir: Path) -> tuple:
+    stats = []
+    for name in CONFIG_FILES:
+        try:
+            st = (config_dir / name).stat()
+            stats.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stats.append(None)
+    return tuple(stats)
 
 class ConfigLoader:
     def __init__(self, config_dir: str = "config"):
@@ -35,33 +101,37 @@ class ConfigLoader:
         self._config: Optional[InfluencerConfig] = None
         self._channels: List[ChannelConfig] = []
 
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Returns the process-wide snapshot for this config dir.
+        Costs two stat() calls when nothing changed; if a file's mtime moved but its
+        content hash did not, the existing snapshot is kept as well.
+        """
+        key = self.config_dir.resolve()
+        stats = _file_stats(key)
+        with _snapshot_lock:
+            cached = _snapshots.get(key)
+            if cached and cached[0] == stats:
+                return cached[1]
+
+            snapshot = _build_snapshot(key)
+            if cached and cached[1].digest == snapshot.digest:
+                snapshot = cached[1]
+            _snapshots[key] = (stats, snapshot)
+            return snapshot
+
     def load(self) -> InfluencerConfig:
-        influencer_path = self.config_dir / "influencers.yaml"
-        if influencer_path.exists():
-            with open(influencer_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            self._config = InfluencerConfig(**data)
-        else:
-             self._config = InfluencerConfig()
+        self._config = self.snapshot().config
         return self._config
 
     def load_channels(self) -> List[ChannelConfig]:
-        channel_path = self.config_dir / "channels.yaml"
-        if channel_path.exists():
-            with open(channel_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data and 'channels' in data:
-                    self._channels = [ChannelConfig(**c) for c in data['channels']]
+        self._channels = list(self.snapshot().channels)
         return self._channels
 
     @property
     def author_names(self) -> List[str]:
-        if not self._config:
-            self.load()
-        return [a.name for a in self._config.authors]
+        return [a.name for a in self.snapshot().config.authors]
     
     @property
     def org_names(self) -> List[str]:
-        if not self._config:
-            self.load()
-        return [o.name for o in self._config.organizations]
+        return [o.name for o in self.snapshot().config.organizations]
@@ -0,0 +1,175 @@
+import hashlib
+import html
+import logging
+import re
+import threading
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from core.utils.signature_cache import SignatureCache
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+class Cluster(NamedTuple):
+    canonical: Dict[str, Any]
+    members: List[Dict[str, Any]]
+
+
+class NearDuplicateIndex:
+    """
+    Groups near-duplicate feed items (same announcement via blog, media, newsletter, HN...).
+    - Each item gets a MinHash signature of its title + summary (character shingles,
+      so it works for English and Chinese alike).
+    - An LSH index (bands x rows) proposes candidate pairs; a candidate joins a cluster
+      when its estimated Jaccard similarity is >= `threshold`. Near-linear in the item count.
+    - Signatures are persisted in a SignatureCache across runs.
+    The canonical item of a cluster is its first member in input order, so callers
+    list their preferred sources (official blogs) first.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.5,
+                 shingle_size: int = 5, seed: int = 1, cache: Optional[SignatureCache] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.cache = cache
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def normalize(item: Dict[str, Any]) -> str:
+        text = f"{item.get('title', '')} {item.get('summary', '')}"
+        text = html.unescape(_TAG_RE.sub(" ", text)).lower()
+        return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+    def _shingles(self, text: str) -> List[str]:
+        k = self.shingle_size
+        if len(text) <= k:
+            return [text]
+        return [text[i:i + k] for i in range(len(text) - k + 1)]
+
+    def signature(self, text: str) -> np.ndarray:
+        # crc32 is stable across processes (unlike hash()), so persisted signatures stay valid
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in set(self._shingles(text))), dtype=np.uint64
+        )
+        permuted = ((np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def _cache_key(self, text: str) -> str:
+        params = f"{self.num_perm}:{self.shingle_size}:{self.seed}:"
+        return hashlib.sha1((params + text).encode("utf-8")).hexdigest()
+
+    def signatures(self, items: List[Dict[str, Any]]) -> List[np.ndarray]:
+        texts = [self.normalize(item) for item in items]
+        keys = [self._cache_key(t) for t in texts]
+        known = self.cache.get_many(keys) if self.cache is not None else {}
+
+        fresh: Dict[str, np.ndarray] = {}
+        sigs = []
+        for key, text in zip(keys, texts):
+            sig = known.get(key)
+            if sig is None:
+                sig = fresh.get(key)
+                if sig is None:
+                    sig = fresh[key] = self.signature(text)
+            sigs.append(sig)
+
+        if self.cache is not None and fresh:
+            self.cache.put_many(fresh)
+        return sigs
+
+    def cluster(self, items: List[Dict[str, Any]]) -> List[Cluster]:
+        """Clusters in order of their canonical item; members keep input order."""
+        if not items:
+            return []
+        sigs = self.signatures(items)
+        parent = list(range(len(items)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for band in range(self.bands):
+            lo, hi = band * self.rows, (band + 1) * self.rows
+            buckets: Dict[bytes, List[int]] = {}
+            for i, sig in enumerate(sigs):
+                bucket = buckets.setdefault(sig[lo:hi].tobytes(), [])
+                for j in bucket:
+                    a, b = find(j), find(i)
+                    if a != b and np.mean(sigs[j] == sig) >= self.threshold:
+                        # Root at the smaller index so the earliest item stays canonical
+                        parent[max(a, b)] = min(a, b)
+                bucket.append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(items)):
+            groups.setdefault(find(i), []).append(i)
+        return [
+            Cluster(canonical=items[members[0]], members=[items[m] for m in members])
+            for _, members in sorted(groups.items())
+        ]
+
+    def dedupe(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        One item per cluster (the canonical one). Collapsed copies are listed
+        under "duplicates" as {"source", "title", "url"}.
+        """
+        return self.dedupe_groups([items])[0]
+
+    def dedupe_groups(self, groups: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        dedupe() across several lists at once (e.g. official / media / tools):
+        a story is kept once, in the earliest group that has it.
+        """
+        flat = [item for items in groups for item in items]
+        merged: Dict[int, Dict[str, Any]] = {}
+        for c in self.cluster(flat):
+            item = dict(c.canonical)
+            copies = [{"source": m.get("source"), "title": m.get("title"), "url": m.get("url")} for m in c.members[1:]]
+            for m in c.members:
+                copies.extend(m.get("duplicates", []))
+            # Items re-deduped from a stored snapshot already list some of these copies
+            seen = {(item.get("source"), item.get("url"))}
+            dupes = []
+            for d in copies:
+                if (d.get("source"), d.get("url")) not in seen:
+                    seen.add((d.get("source"), d.get("url")))
+                    dupes.append(d)
+            if dupes:
+                item["duplicates"] = dupes
+            merged[id(c.canonical)] = item
+
+        if len(merged) < len(flat):
+            logger.info(f"Dedup: {len(flat)} items -> {len(merged)} clusters")
+        return [[merged[id(item)] for item in items if id(item) in merged] for items in groups]
+
+
+_shared_index: Optional[NearDuplicateIndex] = None
+_shared_lock = threading.Lock()
+
+
+def get_dedup_index() -> NearDuplicateIndex:
+    """Process-wide index backed by the shared signature cache."""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = NearDuplicateIndex(cache=SignatureCache())
+        return _shared_index
@@ -0,0 +1,163 @@
+import html
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from xml.etree import ElementTree as ET
+import feedparser
+
+logger = logging.getLogger(__name__)
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+
+ENTRY_TAGS = {"item": "rss20", f"{RSS1}item": "rss10", f"{ATOM}entry": "atom10"}
+FEED_TITLE_TAGS = ("title", f"{RSS1}title", f"{ATOM}title")
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _TextExtractor(HTMLParser):
+    """Markup-free text of an HTML fragment; script / style bodies are dropped."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def _squash(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _plain_text(fragment: str) -> str:
+    if "<" not in fragment and "&" not in fragment:
+        return _squash(fragment)
+    extractor = _TextExtractor()
+    extractor.feed(fragment)
+    extractor.close()
+    return _squash("".join(extractor.parts))
+
+
+def _text(elem: Optional[ET.Element]) -> str:
+    if elem is None:
+        return ""
+    if elem.get("type") == "xhtml":
+        return "".join(elem.itertext()).strip()
+    return (elem.text or "").strip()
+
+
+def _title(elem: Optional[ET.Element]) -> str:
+    # Like feedparser: plain titles verbatim, Atom type="html" titles without markup
+    if elem is not None and elem.get("type") == "html":
+        return _plain_text(_text(elem))
+    return _squash(_text(elem))
+
+
+def _find(elem: ET.Element, *tags: str) -> Optional[ET.Element]:
+    for tag in tags:
+        found = elem.find(tag)
+        if found is not None and (found.text or len(found)):
+            return found
+    return None
+
+
+def _rss_entry(item: ET.Element, ns: str = "") -> Dict[str, str]:
+    return {
+        "title": _title(_find(item, f"{ns}title", f"{DC}title")),
+        "link": _text(_find(item, f"{ns}link")),
+        "id": _text(_find(item, "guid")) or item.get(f"{RDF}about", ""),
+        "published": _text(_find(item, "pubDate", f"{DC}date")),
+        "author": _text(_find(item, f"{DC}creator", "author")),
+        "summary": _text(_find(item, f"{ns}description", f"{CONTENT}encoded")),
+    }
+
+
+def _atom_entry(item: ET.Element) -> Dict[str, str]:
+    link = ""
+    for candidate in item.findall(f"{ATOM}link"):
+        if candidate.get("rel", "alternate") == "alternate":
+            link = candidate.get("href", "")
+            break
+    author = item.find(f"{ATOM}author")
+    return {
+        "title": _title(item.find(f"{ATOM}title")),
+        "link": link,
+        "id": _text(item.find(f"{ATOM}id")),
+        "published": _text(item.find(f"{ATOM}published")),
+        "updated": _text(item.find(f"{ATOM}updated")),
+        "author": _text(author.find(f"{ATOM}name")) if author is not None else "",
+        "summary": _text(_find(item, f"{ATOM}summary", f"{ATOM}content")),
+    }
+
+
+def parse_entries(body: bytes, max_entries: int) -> Optional[feedparser.FeedParserDict]:
+    """
+    Streaming RSS 2.0 / RSS 1.0 / Atom parse that stops after `max_entries` entries.
+    Extracts title, link, id (GUID), published / updated, author and summary.
+    Summaries come back as markup-free text, HTML-escaped, so they can go wherever
+    feedparser's sanitised summaries went. Returns None when the document isn't
+    one it can handle (malformed XML, undefined entities, unknown encodings,
+    no entries); the caller then falls back to feedparser.
+    A body cut off mid-document (FeedFetcher's byte ceiling) yields the entries
+    that were complete.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    entries: List[Dict[str, str]] = []
+    feed_title = ""
+    version = None
+    in_entry = False
+    try:
+        for offset in range(0, len(body), CHUNK_SIZE):
+            parser.feed(body[offset:offset + CHUNK_SIZE])
+            for event, elem in parser.read_events():
+                kind = ENTRY_TAGS.get(elem.tag)
+                if event == "start":
+                    in_entry = in_entry or bool(kind)
+                    continue
+                if kind:
+                    in_entry = False
+                    version = version or kind
+                    entry = _atom_entry(elem) if kind == "atom10" else _rss_entry(elem, RSS1 if kind == "rss10" else "")
+                    entry["summary"] = html.escape(_plain_text(entry["summary"]), quote=False)
+                    entries.append(entry)
+                    elem.clear()
+                    if len(entries) >= max_entries:
+                        break
+                elif not feed_title and not in_entry and elem.tag in FEED_TITLE_TAGS:
+                    feed_title = _title(elem)
+            if len(entries) >= max_entries:
+                break
+        else:
+            try:
+                parser.close()
+            except ET.ParseError:
+                pass  # Body ends mid-document (cut off by the byte ceiling): keep the complete entries
+    except ET.ParseError as e:
+        logger.debug(f"Fast feed parse failed, falling back to feedparser: {e}")
+        return None
+    if not entries:
+        return None
+
+    return feedparser.FeedParserDict(
+        entries=[feedparser.FeedParserDict({k: v for k, v in e.items() if v}) for e in entries],
+        feed=feedparser.FeedParserDict(title=feed_title),
+        version=version,
+        bozo=False,
+    )
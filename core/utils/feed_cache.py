@@ -0,0 +1,94 @@
+import json
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Entry fields the miners and pages actually read. Everything else feedparser
+# produces (content blocks, media, tags...) is not worth persisting.
+ENTRY_FIELDS = ("id", "title", "link", "published", "updated", "author", "summary", "description")
+
+
+class FeedCache:
+    """
+    Persistent per-URL feed cache.
+    Stores HTTP validators (ETag / Last-Modified), a hash of the last body and the
+    last parsed entries, so unchanged feeds cost a 304 and no parsing.
+    One small JSON file per feed keeps concurrent writers from stepping on each other.
+    """
+
+    def __init__(self, cache_dir: str = "outputs/cache/feeds"):
+        self.cache_dir = Path(cache_dir)
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if url in self._memory:
+                return self._memory[url]
+
+        path = self._path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache for {url}: {e}")
+            return None
+
+        with self._lock:
+            self._memory[url] = record
+        return record
+
+    def put(self, url: str, entries: List[Dict[str, Any]], etag: Optional[str] = None,
+            last_modified: Optional[str] = None, body_hash: Optional[str] = None) -> Dict[str, Any]:
+        record = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": body_hash,
+            "fetched_at": time.time(),
+            "entries": entries,
+        }
+        with self._lock:
+            self._memory[url] = record
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(url)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to persist feed cache for {url}: {e}")
+        return record
+
+    def touch(self, url: str) -> None:
+        """Marks a cached feed as revalidated without rewriting its entries."""
+        record = self.get(url)
+        if record:
+            self.put(url, record["entries"], record.get("etag"), record.get("last_modified"), record.get("body_hash"))
+
+    @staticmethod
+    def conditional_headers(record: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        headers = {}
+        if record:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    @staticmethod
+    def serialize_entries(entries) -> List[Dict[str, Any]]:
+        return [{k: e[k] for k in ENTRY_FIELDS if k in e} for e in entries]
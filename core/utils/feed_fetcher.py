@@ -0,0 +1,210 @@
+import feedparser
+import hashlib
+import logging
+import os
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from core.utils.feed_cache import FeedCache
+from core.utils.fast_feed import parse_entries
+from core.utils.tracing import span
+from core.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "AI-Radar/1.0 (+https://github.com/gao-cai-sheng/AI-Radar)"
+
+# Per-feed download ceilings. Only the first few entries of a feed are used, so a
+# body past FEED_MAX_BYTES (decompressed) is cut off and parsed as far as it got;
+# a download still running after FEED_MAX_SECONDS is abandoned.
+FEED_MAX_BYTES = int(os.getenv("FEED_MAX_BYTES", str(2 * 1024 * 1024)))
+FEED_MAX_SECONDS = float(os.getenv("FEED_MAX_SECONDS", "20"))
+# Entries kept per feed: the largest slice any miner or page takes (20) plus headroom
+FEED_MAX_ENTRIES = int(os.getenv("FEED_MAX_ENTRIES", "25"))
+CHUNK_SIZE = 64 * 1024
+
+FETCH_SECONDS = metrics.histogram("radar_feed_fetch_seconds", "Feed download and parse time", ["feed"])
+FETCHES = metrics.counter(
+    "radar_feed_fetches_total",
+    "Feed fetches by outcome (ok, truncated, not_modified, unchanged, error, error_cached)",
+    ["feed", "outcome"],
+)
+PARSES = metrics.counter("radar_feed_parses_total", "Feed bodies parsed, by parser (fast / feedparser)", ["parser"])
+RESPONSE_BYTES = metrics.gauge(
+    "radar_feed_response_bytes", "Last response size per feed, on the wire and decompressed", ["feed", "kind"]
+)
+
+
+class FeedFetcher:
+    """
+    Shared RSS/Atom fetch engine.
+    Feeds are downloaded on a thread pool with a per-host concurrency cap and an
+    explicit timeout, so a sweep of N feeds takes about as long as the slowest one.
+    Bodies are requested compressed (gzip / deflate, plus brotli when the brotli
+    package is installed) and streamed under a byte and a total-time ceiling.
+    Only the first max_entries entries are parsed (core/utils/fast_feed.py),
+    with feedparser as the fallback for feeds the fast parser can't read.
+    With a FeedCache attached, requests are conditional (ETag / Last-Modified) and
+    a 304 or an unchanged body reuses the cached entries without re-parsing.
+    """
+
+    def __init__(self, max_workers: int = 16, per_host_limit: int = 4, timeout: float = 10.0,
+                 cache: Optional[FeedCache] = None, max_bytes: int = FEED_MAX_BYTES,
+                 max_seconds: float = FEED_MAX_SECONDS, max_entries: int = FEED_MAX_ENTRIES):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.max_entries = max_entries
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed-fetch")
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_slots[host] = slot
+        with slot:
+            yield
+
+    def fetch(self, url: str) -> feedparser.FeedParserDict:
+        """
+        Download and parse a single feed.
+        Network errors never raise: the last cached entries (or an empty, bozo
+        feed) are returned instead, mirroring what feedparser.parse(url) does.
+        """
+        start = time.perf_counter()
+        with span("feed.fetch", "fetch", url=url) as s:
+            feed, outcome = self._fetch(url, s)
+            s.set(outcome=outcome)
+
+        FETCH_SECONDS.observe(time.perf_counter() - start, feed=url)
+        FETCHES.inc(feed=url, outcome=outcome)
+        if self.cache:
+            metrics.CACHE_LOOKUPS.inc(cache="feed", result="miss" if outcome in ("ok", "error") else "hit")
+        return feed
+
+    def _fetch(self, url: str, s) -> Tuple[feedparser.FeedParserDict, str]:
+        """
+        Returns: (feed, outcome), outcome one of ok / truncated / not_modified /
+        unchanged / error / error_cached.
+        """
+        cached = self.cache.get(url) if self.cache else None
+
+        try:
+            with self._host_slot(url):
+                resp, body, wire_bytes, truncated = self._download(url, FeedCache.conditional_headers(cached))
+            s.set(status=resp.status_code, bytes=len(body), wire_bytes=wire_bytes, truncated=truncated)
+            metrics.DOWNLOAD_BYTES.inc(wire_bytes, source=urlparse(url).netloc)
+            RESPONSE_BYTES.set(wire_bytes, feed=url, kind="wire")
+            RESPONSE_BYTES.set(len(body), feed=url, kind="decoded")
+            if resp.status_code == 304 and cached:
+                self.cache.touch(url)
+                return _cached_feed(cached, status=304), "not_modified"
+            resp.raise_for_status()
+        except Exception as e:
+            s.set(error=str(e))
+            if cached:
+                logger.warning(f"Feed fetch failed for {url}, serving cached copy: {e}")
+                return _cached_feed(cached, status=None), "error_cached"
+            logger.warning(f"Feed fetch failed for {url}: {e}")
+            return _empty_feed(e), "error"
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        body_hash = hashlib.sha1(body).hexdigest()
+
+        # Server ignored our validators but sent the same bytes: skip the parse
+        if cached and cached.get("body_hash") == body_hash:
+            self.cache.put(url, cached["entries"], etag, last_modified, body_hash)
+            return _cached_feed(cached, status=resp.status_code), "unchanged"
+
+        with span("feed.parse", "parse", url=url) as p:
+            feed = parse_entries(body, self.max_entries)
+            parser = "fast"
+            if feed is None:
+                # feedparser looks headers up by lower-case name
+                feed = feedparser.parse(body, response_headers={k.lower(): v for k, v in resp.headers.items()})
+                feed["entries"] = feed.entries[:self.max_entries]
+                parser = "feedparser"
+            p.set(entries=len(feed.entries), parser=parser)
+        PARSES.inc(parser=parser)
+        if self.cache and feed.entries:
+            self.cache.put(url, FeedCache.serialize_entries(feed.entries), etag, last_modified, body_hash)
+        return feed, "truncated" if truncated else "ok"
+
+    def _download(self, url: str, headers: Dict[str, str]) -> Tuple[requests.Response, bytes, int, bool]:
+        """
+        Streams the (decompressed) body, stopping at max_bytes; gives up with a
+        TimeoutError once max_seconds have passed. A stall between chunks is
+        caught by the read timeout.
+        Returns: (response, body, bytes on the wire, truncated).
+        """
+        deadline = time.monotonic() + self.max_seconds
+        resp = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        chunks, size, truncated = [], 0, False
+        try:
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self.max_bytes:
+                    truncated = True
+                    logger.info(f"Feed {url} cut off at {self.max_bytes} bytes")
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"download exceeded {self.max_seconds:g}s")
+            wire_bytes = resp.raw.tell() or size
+        finally:
+            if not resp.raw.isclosed():
+                # Cut off or failed mid-body: drop the connection instead of draining it
+                resp.close()
+        return resp, b"".join(chunks)[:self.max_bytes], wire_bytes, truncated
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, feedparser.FeedParserDict]:
+        """
+        Fetch feeds concurrently.
+        Returns: {url: parsed_feed}, in the order the URLs were given.
+        """
+        futures = {url: self._executor.submit(self.fetch, url) for url in dict.fromkeys(urls)}
+        return {url: future.result() for url, future in futures.items()}
+
+
+def _empty_feed(error: Exception) -> feedparser.FeedParserDict:
+    return feedparser.FeedParserDict(entries=[], bozo=True, bozo_exception=error)
+
+
+def _cached_feed(record: Dict, status: Optional[int]) -> feedparser.FeedParserDict:
+    entries = [feedparser.FeedParserDict(e) for e in record.get("entries", [])]
+    return feedparser.FeedParserDict(entries=entries, bozo=False, status=status, from_cache=True)
+
+
+_shared_fetcher: Optional[FeedFetcher] = None
+_shared_lock = threading.Lock()
+
+
+def get_feed_fetcher() -> FeedFetcher:
+    """Process-wide fetcher, so every miner and page shares one pool and one set of host limits."""
+    global _shared_fetcher
+    with _shared_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = FeedFetcher(cache=FeedCache())
+        return _shared_fetcher
@@ -0,0 +1,404 @@
+import json
+import sqlite3
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    section TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    item_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_section ON batches(section, id);
+
+CREATE TABLE IF NOT EXISTS papers (
+    url TEXT PRIMARY KEY,
+    title TEXT,
+    published TEXT,
+    hype_score INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    batch_id INTEGER,
+    position INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_papers_batch ON papers(batch_id, position);
+CREATE INDEX IF NOT EXISTS idx_papers_published ON papers(published);
+CREATE INDEX IF NOT EXISTS idx_papers_hype ON papers(hype_score);
+
+CREATE TABLE IF NOT EXISTS paper_channels (
+    url TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    PRIMARY KEY (url, channel)
+);
+CREATE INDEX IF NOT EXISTS idx_paper_channels_channel ON paper_channels(channel);
+
+CREATE TABLE IF NOT EXISTS feed_items (
+    section TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    source TEXT,
+    type TEXT,
+    title TEXT,
+    url TEXT,
+    published TEXT,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    batch_id INTEGER,
+    position INTEGER,
+    PRIMARY KEY (section, item_key)
+);
+CREATE INDEX IF NOT EXISTS idx_feed_items_batch ON feed_items(section, batch_id, position);
+CREATE INDEX IF NOT EXISTS idx_feed_items_source ON feed_items(source);
+CREATE INDEX IF NOT EXISTS idx_feed_items_published ON feed_items(published);
+
+-- Which items each feed batch held, in order. feed_items.batch_id / position only
+-- record the last batch an item appeared in.
+CREATE TABLE IF NOT EXISTS feed_batch_items (
+    batch_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    section TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    PRIMARY KEY (batch_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_feed_batch_items_item ON feed_batch_items(section, item_key);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    paper_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (paper_id, type)
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses(created_at);
+
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_kind ON documents(kind, id);
+
+CREATE TABLE IF NOT EXISTS daily_digests (
+    date TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+-- Change counter per dataset (papers, a feed section, a document kind, analyses, ...),
+-- bumped in the writing transaction so readers in any process can cache by it
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+
+def _dumps(data: Any) -> str:
+    # datetimes (e.g. arxiv `published`) are stored as ISO strings
+    return json.dumps(data, ensure_ascii=False, default=lambda o: o.isoformat() if hasattr(o, 'isoformat') else str(o))
+
+
+def _iso(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+class ItemStore:
+    """
+    Embedded SQLite store for everything the radar collects:
+    papers, feed items (news / discourse / products / podcasts), paper analyses,
+    generated documents (digests, current deep dive) and daily digests.
+
+    Saving a list creates a new "batch" for its section instead of overwriting:
+    items are upserted (history is kept) and the latest batch is what the UI shows.
+    """
+
+    def __init__(self, path: str = "outputs/radar.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._backfill_batch_items()
+        self._conn.commit()
+
+    def _commit(self, dataset: str) -> None:
+        self._conn.execute(
+            "INSERT INTO versions (name, version) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET version = versions.version + 1",
+            (dataset,),
+        )
+        self._conn.commit()
+
+    def version(self, dataset: str) -> int:
+        """
+        Changes whenever `dataset` does ("papers", a feed section or document kind,
+        "analyses", ...), whichever process wrote it; writes to other datasets leave
+        it alone. A primary-key lookup, cheap enough to check on every UI rerun.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM versions WHERE name = ?", (dataset,)).fetchone()
+        return row[0] if row else 0
+
+    # --- Batches ---
+    def _new_batch(self, section: str, count: int) -> int:
+        cur = self._conn.execute(
+            "INSERT INTO batches (section, created_at, item_count) VALUES (?, ?, ?)",
+            (section, time.time(), count),
+        )
+        return cur.lastrowid
+
+    def latest_batch(self, section: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT * FROM batches WHERE section = ? ORDER BY id DESC LIMIT 1", (section,)
+            ).fetchone()
+
+    def last_updated(self, section: str) -> Optional[float]:
+        batch = self.latest_batch(section)
+        return batch["created_at"] if batch else None
+
+    # --- Papers ---
+    def upsert_papers(self, papers: Iterable[Dict[str, Any]], batch_id: Optional[int] = None) -> None:
+        """Inserts or refreshes papers. With batch_id, they also become that batch's members."""
+        now = time.time()
+        with self._lock:
+            for position, p in enumerate(papers):
+                self._conn.execute(
+                    """
+                    INSERT INTO papers (url, title, published, hype_score, data, first_seen, last_seen, batch_id, position)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        title = excluded.title, published = excluded.published, hype_score = excluded.hype_score,
+                        data = excluded.data, last_seen = excluded.last_seen,
+                        batch_id = COALESCE(excluded.batch_id, papers.batch_id),
+                        position = COALESCE(excluded.position, papers.position)
+                    """,
+                    (p['url'], p.get('title'), _iso(p.get('published')), p.get('hype_score', 0), _dumps(p),
+                     now, now, batch_id, position if batch_id is not None else None),
+                )
+                self._conn.execute("DELETE FROM paper_channels WHERE url = ?", (p['url'],))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO paper_channels (url, channel) VALUES (?, ?)",
+                    [(p['url'], c) for c in p.get('channels', [])],
+                )
+            self._commit("papers")
+
+    def save_papers_batch(self, papers: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            batch_id = self._new_batch("papers", len(papers))
+            self.upsert_papers(papers, batch_id)
+            return batch_id
+
+    def latest_papers(self, channel: Optional[str] = None, min_score: Optional[int] = None,
+                      limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Members of the latest papers batch, in saved order."""
+        batch = self.latest_batch("papers")
+        if not batch:
+            return []
+        sql = "SELECT p.data FROM papers p"
+        args: List[Any] = []
+        if channel:
+            sql += " JOIN paper_channels c ON c.url = p.url AND c.channel = ?"
+            args.append(channel)
+        sql += " WHERE p.batch_id = ?"
+        args.append(batch["id"])
+        if min_score is not None:
+            sql += " AND p.hype_score >= ?"
+            args.append(min_score)
+        sql += " ORDER BY p.position"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            args += [limit, offset]
+        with self._lock:
+            return [json.loads(r["data"]) for r in self._conn.execute(sql, args)]
+
+    def recent_papers(self, limit: int = 1000) -> List[Dict[str, Any]]:
+        """All stored papers, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM papers ORDER BY published DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [json.loads(r["data"]) for r in rows]
+
+    # --- Feed items ---
+    def _backfill_batch_items(self) -> None:
+        # Stores written before feed_batch_items existed: their batch members live on feed_items
+        if self._conn.execute("SELECT 1 FROM feed_batch_items LIMIT 1").fetchone():
+            return
+        self._conn.execute(
+            "INSERT OR IGNORE INTO feed_batch_items (batch_id, position, section, item_key) "
+            "SELECT batch_id, position, section, item_key FROM feed_items WHERE batch_id IS NOT NULL"
+        )
+
+    @staticmethod
+    def _feed_keys(batch_id: int, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Row key per item: source + URL (or title). Items without either, and repeats of
+        a key within the batch, get keys of their own so no item overwrites another.
+        """
+        keys, seen = [], set()
+        for position, item in enumerate(items):
+            ident = item.get('url') or item.get('title')
+            key = f"{item.get('source') or ''}|{ident}" if ident else f"#{batch_id}:{position}"
+            if key in seen:
+                key = f"{key}#{position}"
+            seen.add(key)
+            keys.append(key)
+        return keys
+
+    def save_feed_batch(self, section: str, items: List[Dict[str, Any]]) -> int:
+        """
+        Saves `items` as the section's new batch. Every batch keeps its own member
+        list, so earlier batches stay intact; an item seen before keeps its first_seen.
+        """
+        now = time.time()
+        with self._lock:
+            batch_id = self._new_batch(section, len(items))
+            for position, (key, item) in enumerate(zip(self._feed_keys(batch_id, items), items)):
+                self._conn.execute(
+                    """
+                    INSERT INTO feed_items (section, item_key, source, type, title, url, published, data,
+                                            first_seen, last_seen, batch_id, position)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(section, item_key) DO UPDATE SET
+                        source = excluded.source, type = excluded.type, title = excluded.title,
+                        published = excluded.published, data = excluded.data, last_seen = excluded.last_seen,
+                        batch_id = excluded.batch_id, position = excluded.position
+                    """,
+                    (section, key, item.get('source'), item.get('type'), item.get('title'), item.get('url'),
+                     _iso(item.get('published')), _dumps(item), now, now, batch_id, position),
+                )
+                self._conn.execute(
+                    "INSERT INTO feed_batch_items (batch_id, position, section, item_key) VALUES (?, ?, ?, ?)",
+                    (batch_id, position, section, key),
+                )
+            self._commit(section)
+            return batch_id
+
+    def latest_feed_items(self, section: str, item_type: Optional[str] = None, source: Optional[str] = None,
+                          limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        batch = self.latest_batch(section)
+        if not batch:
+            return []
+        sql = ("SELECT f.data FROM feed_batch_items m "
+               "JOIN feed_items f ON f.section = m.section AND f.item_key = m.item_key "
+               "WHERE m.section = ? AND m.batch_id = ?")
+        args: List[Any] = [section, batch["id"]]
+        if item_type:
+            sql += " AND f.type = ?"
+            args.append(item_type)
+        if source:
+            sql += " AND f.source = ?"
+            args.append(source)
+        sql += " ORDER BY m.position"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            args += [limit, offset]
+        with self._lock:
+            return [json.loads(r["data"]) for r in self._conn.execute(sql, args)]
+
+    # --- Analyses ---
+    def save_analysis(self, paper_id: str, analysis_type: str, data: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (paper_id, type, data, created_at) VALUES (?, ?, ?, ?)",
+                (paper_id, analysis_type, _dumps(data), time.time()),
+            )
+            self._commit("analyses")
+
+    def get_analysis(self, paper_id: str, analysis_type: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM analyses WHERE paper_id = ? AND type = ?", (paper_id, analysis_type)
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def all_analyses(self, types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns: {paper_id: {"type": ..., "data": ...}}, the most recent analysis per paper.
+        """
+        sql = "SELECT paper_id, type, data FROM analyses"
+        args: List[Any] = []
+        if types is not None:
+            types = list(types)
+            sql += f" WHERE type IN ({', '.join('?' * len(types))})"
+            args = types
+        sql += " ORDER BY created_at"
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return {r["paper_id"]: {"type": r["type"], "data": json.loads(r["data"])} for r in rows}
+
+    # --- Documents (news digest, current deep dive, ...) ---
+    def save_document(self, kind: str, data: Any) -> None:
+        with self._lock:
+            self._new_batch(kind, 1)
+            self._conn.execute(
+                "INSERT INTO documents (kind, data, created_at) VALUES (?, ?, ?)", (kind, _dumps(data), time.time())
+            )
+            self._commit(kind)
+
+    def latest_document(self, kind: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM documents WHERE kind = ? ORDER BY id DESC LIMIT 1", (kind,)
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    # --- Daily digests ---
+    def save_daily_digest(self, date: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO daily_digests (date, data, created_at) VALUES (?, ?, ?)",
+                (date, _dumps(data), time.time()),
+            )
+            self._commit("daily_digests")
+
+    def get_daily_digest(self, date: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM daily_digests WHERE date = ?", (date,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    # --- Meta (small state such as the ArXiv high-water mark) ---
+    def get_meta(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else None
+
+    def set_meta(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, _dumps(value)))
+            self._commit("meta")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[Path, ItemStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_item_store(path: str = "outputs/radar.db") -> ItemStore:
+    """Process-wide store per database file."""
+    key = Path(path).resolve()
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = ItemStore(path)
+        return _stores[key]
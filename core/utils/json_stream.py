@@ -0,0 +1,62 @@
+import json
+from typing import Any, Dict
+
+
+class JSONSectionParser:
+    """
+    Incremental parser for a streamed JSON object.
+    feed() returns the top-level members ("sections") completed by the new chunk,
+    so a long structured report can be rendered section by section.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = None
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        self.text += chunk
+        completed: Dict[str, Any] = {}
+
+        for i in range(self._pos, len(self.text)):
+            ch = self.text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+                if self._depth == 1 and ch == '{':
+                    self._member_start = i + 1
+            elif ch in '}]':
+                if self._depth == 1:
+                    completed.update(self._close_member(i))
+                self._depth -= 1
+            elif ch == ',' and self._depth == 1:
+                completed.update(self._close_member(i))
+                self._member_start = i + 1
+
+        self._pos = len(self.text)
+        return completed
+
+    def _close_member(self, end: int) -> Dict[str, Any]:
+        if self._member_start is None:
+            return {}
+        member = self.text[self._member_start:end].strip()
+        if not member:
+            return {}
+        try:
+            return json.loads("{" + member + "}")
+        except ValueError:
+            # Malformed section: leave it to the final full parse
+            return {}
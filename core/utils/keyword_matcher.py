@@ -0,0 +1,148 @@
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+
+class KeywordHit(NamedTuple):
+    term: str       # lowercased term that matched
+    category: str   # "author", "org", "channel", "safety", ...
+    label: str      # what the hit means, e.g. the channel name or the original-case org name
+    start: int
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _ends_word(text: str, end: int) -> bool:
+    """True when text[end:] starts with a non-word character, the end, or a plural "s" followed by either."""
+    if end < len(text) and text[end] == 's':
+        end += 1
+    return end >= len(text) or not _is_word_char(text[end])
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher (Aho-Corasick) over every watchlist at once:
+    authors, organizations, channel keywords, safety keywords...
+    One pass over the text finds every term, whatever the watchlist size.
+
+    Matching is case-insensitive and bounded by words on both sides: "rag" fires
+    neither inside "storage" nor in "ragged", while "risk" still matches "risks"
+    (a trailing plural "s" is allowed).
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._terms: List[tuple] = []  # (term, category, label)
+        self._built = True
+
+    def add(self, term: str, category: str, label: Optional[str] = None) -> None:
+        term_lc = term.strip().lower()
+        if not term_lc:
+            return
+        node = 0
+        for ch in term_lc:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(len(self._terms))
+        self._terms.append((term_lc, category, label if label is not None else term))
+        self._built = False
+
+    def add_many(self, terms: Iterable[str], category: str, label: Optional[str] = None) -> None:
+        for term in terms:
+            self.add(term, category, label)
+
+    def build(self) -> "KeywordMatcher":
+        """Computes failure links. Called lazily by find()."""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+        self._built = True
+        return self
+
+    def find(self, text: str, categories: Optional[Set[str]] = None) -> List[KeywordHit]:
+        """
+        Returns every hit in `text` (overlapping hits included), in text order.
+        """
+        if not self._built:
+            self.build()
+        goto, fail, out, terms = self._goto, self._fail, self._out, self._terms
+        text_lc = text.lower()
+
+        hits = []
+        node = 0
+        for i, ch in enumerate(text_lc):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            for term_idx in out[node]:
+                term, category, label = terms[term_idx]
+                if categories is not None and category not in categories:
+                    continue
+                start = i - len(term) + 1
+                if start > 0 and _is_word_char(term[0]) and _is_word_char(text_lc[start - 1]):
+                    continue
+                if _is_word_char(term[-1]) and not _ends_word(text_lc, i + 1):
+                    continue
+                hits.append(KeywordHit(term, category, label, start, i + 1))
+        return hits
+
+    def labels(self, text: str, category: str) -> List[str]:
+        """Distinct labels of `category` found in text, in order of first appearance."""
+        return list(dict.fromkeys(h.label for h in self.find(text, {category})))
+
+    def has_any(self, text: str, category: str) -> bool:
+        return bool(self.find(text, {category}))
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @classmethod
+    def from_config(cls, config_loader, extra: Optional[Dict[str, Iterable[str]]] = None) -> "KeywordMatcher":
+        """
+        Builds one matcher over the configured watchlists:
+        - "author": author names (label = name)
+        - "org": organization names (label = name)
+        - "channel": channel keywords (label = channel name)
+        plus any `extra` {category: terms}, e.g. {"safety": [...]}.
+        Without `extra` this is the matcher precompiled in the config snapshot.
+        """
+        snapshot = config_loader.snapshot()
+        if not extra:
+            return snapshot.matcher
+        return cls.from_watchlists(snapshot.config, snapshot.channels, extra)
+
+    @classmethod
+    def from_watchlists(cls, config, channels, extra: Optional[Dict[str, Iterable[str]]] = None) -> "KeywordMatcher":
+        """Same as from_config(), from an already parsed InfluencerConfig and channel list."""
+        matcher = cls()
+        for author in config.authors:
+            matcher.add(author.name, "author")
+        for org in config.organizations:
+            matcher.add(org.name, "org")
+        for channel in channels:
+            matcher.add_many(channel.keywords, "channel", channel.name)
+        for category, terms in (extra or {}).items():
+            matcher.add_many(terms, category)
+        return matcher.build()
@@ -0,0 +1,107 @@
+import contextvars
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from core.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class Stage(NamedTuple):
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...]
+
+
+class Pipeline:
+    """
+    Small DAG runner. A stage starts, on its own thread, as soon as the stages it
+    depends on have finished, and gets their results as keyword arguments.
+    Stages must be added after their dependencies, so the graph is acyclic by
+    construction. A failing stage skips everything downstream of it; run()
+    re-raises the first error once the independent branches are done.
+    Every stage runs in the caller's contextvars and inside a tracing span.
+    """
+
+    def __init__(self, name: str = "pipeline", max_workers: Optional[int] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, Tuple[float, float]] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = ()) -> None:
+        if name in self.stages:
+            raise ValueError(f"Stage {name} already added")
+        unknown = [d for d in deps if d not in self.stages]
+        if unknown:
+            raise ValueError(f"Stage {name} depends on unknown stages {unknown}")
+        self.stages[name] = Stage(name, fn, tuple(deps))
+
+    def run(self) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        waiting = dict(self.stages)
+        running: Dict[Future, str] = {}
+        origin = time.perf_counter()
+        self.timings = {}
+
+        def call(stage: Stage, kwargs: Dict[str, Any]) -> Any:
+            start = time.perf_counter()
+            try:
+                with span(stage.name, "stage"):
+                    return stage.fn(**kwargs)
+            finally:
+                self.timings[stage.name] = (start - origin, time.perf_counter() - origin)
+
+        workers = self.max_workers or max(1, len(self.stages))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name) as pool:
+            while waiting or running:
+                for name, stage in list(waiting.items()):
+                    if any(d in errors for d in stage.deps):
+                        errors[name] = RuntimeError("skipped: upstream stage failed")
+                        del waiting[name]
+                    elif all(d in results for d in stage.deps):
+                        kwargs = {d: results[d] for d in stage.deps}
+                        ctx = contextvars.copy_context()
+                        running[pool.submit(ctx.run, call, stage, kwargs)] = name
+                        del waiting[name]
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"{self.name}: stage {name} failed: {e}")
+                        errors[name] = e
+
+        failed = [n for n in self.stages if n in errors and n in self.timings]
+        if failed:
+            raise errors[failed[0]]
+        return results
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        The chain of stages that determined the run time (each one waiting on the
+        dependency that finished last), and the run's wall time in seconds.
+        """
+        if not self.timings:
+            return [], 0.0
+        name = max(self.timings, key=lambda n: self.timings[n][1])
+        total = self.timings[name][1]
+        path = [name]
+        while True:
+            deps = [d for d in self.stages[name].deps if d in self.timings]
+            if not deps:
+                break
+            name = max(deps, key=lambda d: self.timings[d][1])
+            path.append(name)
+        return path[::-1], total
+
+    def report(self) -> str:
+        path, total = self.critical_path()
+        lines = [f"  {n:<16} {s:7.2f}s → {e:7.2f}s" for n, (s, e) in sorted(self.timings.items(), key=lambda kv: kv[1])]
+        lines.append(f"  critical path: {' → '.join(path)} ({total:.2f}s)")
+        return "\n".join(lines)
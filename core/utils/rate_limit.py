@@ -0,0 +1,78 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate_per_minute`.
+    acquire(n) blocks until n tokens are available.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> None:
+        # A request bigger than the bucket could never be served; clamp it
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Provider limits: requests per minute and (optionally) tokens per minute.
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+
+    def acquire(self, tokens: float = 0) -> None:
+        if self.requests:
+            self.requests.acquire(1)
+        if self.tokens and tokens:
+            self.tokens.acquire(tokens)
+
+
+def bounded_map(fn: Callable[[T], R], items: Iterable[T], max_in_flight: int = 4,
+                limiter: Optional[RateLimiter] = None,
+                cost: Optional[Callable[[T], float]] = None) -> List[R]:
+    """
+    Runs fn over items with at most `max_in_flight` calls at once, each call first
+    clearing the rate limiter (cost(item) = estimated tokens).
+    Results keep the order of `items`. Each call sees the caller's contextvars
+    (e.g. the usage_scope a digest run is tagged with).
+    """
+    items = list(items)
+    if not items:
+        return []
+    contexts = [contextvars.copy_context() for _ in items]
+
+    def run(item: T) -> R:
+        if limiter:
+            limiter.acquire(cost(item) if cost else 0)
+        return fn(item)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix="bounded-map") as pool:
+        return list(pool.map(lambda ctx, item: ctx.run(run, item), contexts, items))
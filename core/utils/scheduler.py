@@ -0,0 +1,244 @@
+import logging
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from core.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+REFRESH_RUNS = metrics.counter("radar_refresh_runs_total", "Scheduled refreshes by job and outcome (ok / error / busy)",
+                               ["job", "outcome"])
+REFRESH_SECONDS = metrics.histogram("radar_refresh_seconds", "Duration of scheduled refreshes", ["job"])
+REFRESH_LAST_OK = metrics.gauge("radar_refresh_last_success_timestamp", "Unix time of the last successful refresh",
+                                ["job"])
+
+
+class LeaseStore:
+    """
+    Named, expiring locks in a small SQLite file, shared by every process on the
+    machine (the scheduler daemon, Streamlit sessions, daily_digest). Kept out of
+    outputs/radar.db so taking a lease doesn't invalidate the UI's data caches.
+    """
+
+    def __init__(self, path: str = "outputs/cache/leases.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def acquire(self, name: str, owner: str, ttl: float) -> bool:
+        """Takes the lease unless another owner holds an unexpired one."""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                """
+                INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE leases.expires_at < ?
+                """,
+                (name, owner, now + ttl, now),
+            )
+            self._conn.commit()
+            return cur.rowcount == 1
+
+    def renew(self, name: str, owner: str, ttl: float) -> bool:
+        """Pushes the expiry of a lease `owner` holds; False if it no longer holds it."""
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE name = ? AND owner = ?", (time.time() + ttl, name, owner)
+            )
+            self._conn.commit()
+            return cur.rowcount == 1
+
+    def release(self, name: str, owner: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+            self._conn.commit()
+
+    def holder(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT owner FROM leases WHERE name = ? AND expires_at >= ?", (name, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared_leases: Optional[LeaseStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_lease_store() -> LeaseStore:
+    global _shared_leases
+    with _shared_lock:
+        if _shared_leases is None:
+            _shared_leases = LeaseStore()
+        return _shared_leases
+
+
+@contextmanager
+def single_flight(name: str, ttl: float = 600.0, leases: Optional[LeaseStore] = None) -> Iterator[bool]:
+    """
+    Yields True when this caller got to run `name`, False when someone else (any
+    thread or process) is already running it. While the block runs, the lease is
+    renewed every ttl / 3 seconds, so a long run keeps it however long it takes;
+    a crashed holder stops renewing and loses it after at most `ttl` seconds.
+    """
+    leases = leases or get_lease_store()
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    acquired = leases.acquire(name, owner, ttl)
+    if not acquired:
+        yield False
+        return
+
+    done = threading.Event()
+
+    def heartbeat() -> None:
+        while not done.wait(ttl / 3):
+            try:
+                if not leases.renew(name, owner, ttl):
+                    logger.warning(f"Lost the {name} lease while still running")
+                    return
+            except sqlite3.Error as e:
+                logger.warning(f"Could not renew the {name} lease: {e}")
+
+    renewer = threading.Thread(target=heartbeat, name=f"lease-{name}", daemon=True)
+    renewer.start()
+    try:
+        yield True
+    finally:
+        done.set()
+        renewer.join()
+        leases.release(name, owner)
+
+
+def lease_name(job: str) -> str:
+    """Lease shared by scheduled runs and manual triggers of the same job."""
+    return f"refresh:{job}"
+
+
+@dataclass
+class Job:
+    """
+    A periodic task. Lower priority values go first when more jobs are due than
+    there are workers. Each run is spread by +/- jitter (a fraction of the interval)
+    so jobs started together drift apart. last_run, if given, returns when the job's
+    output was last produced (e.g. the store's last batch), so a restarted daemon
+    doesn't refetch everything at once. timeout_s is the lease TTL: a running job
+    keeps renewing it, so it only bounds how long a crashed run blocks the job.
+    """
+    name: str
+    fn: Callable[[], Any]
+    interval_s: float
+    priority: int = 10
+    jitter: float = 0.1
+    timeout_s: float = 120.0
+    last_run: Optional[Callable[[], Optional[float]]] = None
+
+    def next_delay(self) -> float:
+        return self.interval_s * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class Scheduler:
+    """
+    Runs jobs on their intervals from a small worker pool until stop() is called.
+    A job is never run twice at once: not within this process (it isn't resubmitted
+    while in flight) and not across processes (single_flight lease per job).
+    A run that finds the lease taken counts as "busy" and waits for its next turn.
+    """
+
+    def __init__(self, jobs: List[Job], max_workers: int = 2, leases: Optional[LeaseStore] = None):
+        self.jobs = {job.name: job for job in jobs}
+        self.max_workers = max_workers
+        self.leases = leases
+        self.next_run: Dict[str, float] = {}
+        self._running: Dict[str, Future] = {}
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def _first_run(self, job: Job) -> float:
+        now = time.time()
+        last = job.last_run() if job.last_run else None
+        if last is None:
+            return now
+        return max(now, last + job.next_delay())
+
+    def _run_job(self, job: Job) -> str:
+        start = time.perf_counter()
+        with single_flight(lease_name(job.name), ttl=job.timeout_s, leases=self.leases) as acquired:
+            if not acquired:
+                logger.info(f"Skipping {job.name}: already running elsewhere")
+                return "busy"
+            try:
+                job.fn()
+            except Exception as e:
+                logger.error(f"Job {job.name} failed: {e}")
+                return "error"
+            finally:
+                REFRESH_SECONDS.observe(time.perf_counter() - start, job=job.name)
+        REFRESH_LAST_OK.set(time.time(), job=job.name)
+        return "ok"
+
+    def _done(self, name: str, future: Future) -> None:
+        outcome = "error" if future.exception() else future.result()
+        REFRESH_RUNS.inc(job=name, outcome=outcome)
+        job = self.jobs[name]
+        self.next_run[name] = time.time() + job.next_delay()
+        self._running.pop(name, None)
+        logger.info(f"{name}: {outcome}, next in {self.next_run[name] - time.time():.0f}s")
+        self._wake.set()
+
+    def run_once(self) -> Dict[str, str]:
+        """Runs every job once, highest priority first, and returns each outcome."""
+        ordered = sorted(self.jobs.values(), key=lambda j: j.priority)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="refresh") as pool:
+            futures = {job.name: pool.submit(self._run_job, job) for job in ordered}
+        outcomes = {}
+        for name, future in futures.items():
+            outcomes[name] = future.result()
+            REFRESH_RUNS.inc(job=name, outcome=outcomes[name])
+        return outcomes
+
+    def run_forever(self) -> None:
+        for job in self.jobs.values():
+            self.next_run[job.name] = self._first_run(job)
+            logger.info(f"{job.name}: every {job.interval_s:.0f}s, first run in "
+                        f"{max(0.0, self.next_run[job.name] - time.time()):.0f}s")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="refresh") as pool:
+            while not self._stop.is_set():
+                now = time.time()
+                due = sorted(
+                    (j for j in self.jobs.values() if j.name not in self._running and self.next_run[j.name] <= now),
+                    key=lambda j: (j.priority, self.next_run[j.name]),
+                )
+                for job in due[:max(0, self.max_workers - len(self._running))]:
+                    future = pool.submit(self._run_job, job)
+                    self._running[job.name] = future
+                    future.add_done_callback(lambda f, name=job.name: self._done(name, f))
+
+                idle = [self.next_run[n] for n in self.jobs if n not in self._running]
+                timeout = max(0.0, min(idle) - time.time()) if idle else None
+                self._wake.wait(timeout)
+                self._wake.clear()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a star / like count (SIGNAL_CACHE_TTL) or a 404 (SIGNAL_CACHE_NEGATIVE_TTL) is reused
+SIGNAL_CACHE_TTL = float(os.getenv("SIGNAL_CACHE_TTL", str(24 * 3600)))
+SIGNAL_CACHE_NEGATIVE_TTL = float(os.getenv("SIGNAL_CACHE_NEGATIVE_TTL", str(6 * 3600)))
+
+
+class SignalCache:
+    """
+    Disk-backed TTL cache for code signals (GitHub stars, HF likes).
+    - Positive results live for `ttl` seconds, 404s for `negative_ttl` seconds.
+    - At most `max_entries` rows are kept; once over, least-recently-used rows are
+      evicted down to 90% of it, so eviction runs once per many inserts.
+    - hits / misses are counted per process, see stats().
+    """
+
+    def __init__(self, path: str = "outputs/cache/code_signals.db", ttl: float = SIGNAL_CACHE_TTL,
+                 negative_ttl: float = SIGNAL_CACHE_NEGATIVE_TTL, max_entries: int = 50000):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS signals (
+                key TEXT PRIMARY KEY,
+                value INTEGER,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_access ON signals(last_access)")
+        self._conn.commit()
+        # Upper bound on the row count (replacements count as inserts); the real
+        # COUNT(*) only runs once this crosses max_entries
+        self._size = self._conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+
+    def get(self, key: str) -> Tuple[bool, Optional[int]]:
+        """
+        Returns: (hit, value). A hit with value None is a cached "not found".
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, fetched_at FROM signals WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                value, fetched_at = row
+                ttl = self.ttl if value is not None else self.negative_ttl
+                if now - fetched_at < ttl:
+                    self._conn.execute("UPDATE signals SET last_access = ? WHERE key = ?", (now, key))
+                    self._conn.commit()
+                    self.hits += 1
+                    return True, value
+            self.misses += 1
+        return False, None
+
+    def set(self, key: str, value: Optional[int]) -> None:
+        """Stores a count, or None to negative-cache a missing repo/model."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO signals (key, value, fetched_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._size += 1
+            if self._size > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+        if count > self.max_entries:
+            overflow = count - int(self.max_entries * 0.9)
+            self._conn.execute(
+                "DELETE FROM signals WHERE key IN (SELECT key FROM signals ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+            count -= overflow
+        self._size = count
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,86 @@
+import sqlite3
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SignatureCache:
+    """
+    Disk-backed store of MinHash signatures, keyed by a hash of the item text
+    (and the MinHash parameters), so items seen in earlier runs are not re-hashed.
+    At most `max_entries` rows are kept; least-recently-seen rows are evicted first.
+    """
+
+    def __init__(self, path: str = "outputs/cache/signatures.db", max_entries: int = 100000):
+        self.path = Path(path)
+        self.max_entries = max_entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS signatures (
+                key TEXT PRIMARY KEY,
+                signature BLOB NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_signatures_seen ON signatures(last_seen)")
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, np.ndarray] = {}
+        now = time.time()
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, signature FROM signatures WHERE key IN ({marks})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.uint64)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE signatures SET last_seen = ? WHERE key = ?", [(now, key) for key, _ in rows]
+                    )
+            self._conn.commit()
+        return found
+
+    def put_many(self, signatures: Dict[str, np.ndarray]) -> None:
+        if not signatures:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO signatures (key, signature, last_seen) VALUES (?, ?, ?)",
+                [(key, sig.astype(np.uint64).tobytes(), now) for key, sig in signatures.items()],
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM signatures WHERE key IN (SELECT key FROM signatures ORDER BY last_seen ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
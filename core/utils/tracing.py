@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """
+    One timed section. Use as a context manager; set() attaches details such as
+    bytes, status or outcome. An exception marks the span outcome="error".
+    """
+
+    __slots__ = ("tracer", "name", "cat", "args", "_start", "_cpu")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def set(self, **args: Any) -> None:
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self._cpu = time.thread_time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter()
+        cpu = time.thread_time() - self._cpu
+        if exc is not None:
+            self.args.setdefault("outcome", "error")
+            self.args.setdefault("error", f"{exc_type.__name__}: {exc}")
+        self.tracer._record(self, self._start, end, cpu)
+        return False
+
+
+class _NullSpan:
+    """Returned while tracing is off: no clock reads, no allocation."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Collects spans and writes them in Chrome trace-event format
+    (open in chrome://tracing or https://ui.perfetto.dev).
+    Each span carries wall time, thread CPU time and whatever details were set().
+    At most `max_events` spans are kept per trace; later ones are counted in `dropped`.
+    """
+
+    def __init__(self, enabled: bool = False, max_events: int = 200000):
+        self.enabled = enabled
+        self.max_events = max_events
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def span(self, name: str, cat: str = "stage", **args: Any):
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, cat, args)
+
+    def start(self) -> None:
+        """Begins a fresh trace (drops spans of a previous one)."""
+        with self._lock:
+            self._events = []
+            self._threads = {}
+            self.dropped = 0
+            self._origin = time.perf_counter()
+        self.enabled = True
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def _record(self, span: Span, start: float, end: float, cpu: float) -> None:
+        thread = threading.current_thread()
+        args = dict(span.args)
+        args["cpu_ms"] = round(cpu * 1000, 3)
+        event = {
+            "name": span.name,
+            "cat": span.cat,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": self._pid,
+            "tid": thread.ident,
+            "args": args,
+        }
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            meta = [
+                {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._threads.items()
+            ]
+            return meta + list(self._events)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per span name: count, total wall seconds and CPU seconds."""
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for e in self._events:
+                t = totals.setdefault(e["name"], {"count": 0, "wall_s": 0.0, "cpu_s": 0.0})
+                t["count"] += 1
+                t["wall_s"] += e["dur"] / 1e6
+                t["cpu_s"] += e["args"]["cpu_ms"] / 1000
+        return totals
+
+    def save(self, path: str) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+        logger.info(f"Trace written to {path}")
+        return path
+
+
+_tracer = Tracer(enabled=os.getenv("RADAR_TRACE", "0").lower() in ("1", "true", "on"))
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer; RADAR_TRACE=1 turns it on at import time."""
+    return _tracer
+
+
+def span(name: str, cat: str = "stage", **args: Any):
+    """Shortcut for get_tracer().span(...)."""
+    return _tracer.span(name, cat, **args)
@@ -0,0 +1,235 @@
+import argparse
+import contextvars
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens: (prompt, cached prompt, completion).
+# LLM_PRICE_PER_MTOK="in,cached,out" overrides these for every model.
+PRICES_PER_MTOK: Dict[str, Tuple[float, float, float]] = {
+    "deepseek-chat": (0.27, 0.07, 1.10),
+    "deepseek-reasoner": (0.55, 0.14, 2.19),
+}
+
+ROLLUP_KEYS = ("day", "feature", "model", "item", "run_id")
+
+_scope: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar("llm_usage_scope", default={})
+
+
+@contextmanager
+def usage_scope(**labels: str) -> Iterator[None]:
+    """
+    Tags every LLM call made inside the block, e.g. usage_scope(run_id=...) around a
+    digest run and usage_scope(item=paper_id) around one paper. Scopes nest.
+    """
+    token = _scope.set({**_scope.get(), **{k: v for k, v in labels.items() if v}})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def current_scope() -> Dict[str, str]:
+    return dict(_scope.get())
+
+
+def _prices(model: str) -> Tuple[float, float, float]:
+    override = os.getenv("LLM_PRICE_PER_MTOK")
+    if override:
+        prompt, cached, completion = (float(x) for x in override.split(","))
+        return prompt, cached, completion
+    return PRICES_PER_MTOK.get(model, (0.0, 0.0, 0.0))
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+    prompt, cached, completion = _prices(model)
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (uncached * prompt + cached_tokens * cached + completion_tokens * completion) / 1e6
+
+
+class UsageLedger:
+    """
+    One row per LLM call: feature (prompt template), model, outcome, prompt /
+    cached / completion tokens, latency and estimated cost, tagged with the
+    current usage_scope (run_id, item). Response-cache hits are recorded at zero
+    cost so rollups show what the cache saved.
+    """
+
+    def __init__(self, path: str = "outputs/cache/llm_usage.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS calls (
+                ts REAL NOT NULL,
+                day TEXT NOT NULL,
+                run_id TEXT,
+                item TEXT,
+                feature TEXT NOT NULL,
+                model TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                cached_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                latency_s REAL NOT NULL DEFAULT 0,
+                cost_usd REAL NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_calls_day ON calls(day)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_calls_run ON calls(run_id)")
+        self._conn.commit()
+
+    def record(self, feature: str, model: str, outcome: str, usage: Optional[Dict[str, int]] = None,
+               latency_s: float = 0.0, scope: Optional[Dict[str, str]] = None) -> float:
+        """
+        Stores one call and returns its estimated cost in USD. scope defaults to the
+        current usage_scope; callers that outlive the block (generators) pass it in.
+        """
+        usage = usage or {}
+        prompt = usage.get("prompt_tokens") or 0
+        cached = usage.get("cached_tokens") or 0
+        completion = usage.get("completion_tokens") or 0
+        cost = estimate_cost(model, prompt, completion, cached)
+        scope = _scope.get() if scope is None else scope
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO calls (ts, day, run_id, item, feature, model, outcome, prompt_tokens, cached_tokens, "
+                "completion_tokens, latency_s, cost_usd) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (now, datetime.fromtimestamp(now).strftime("%Y-%m-%d"), scope.get("run_id"), scope.get("item"),
+                 feature, model, outcome, prompt, cached, completion, latency_s, cost),
+            )
+            self._conn.commit()
+        return cost
+
+    def spent(self, run_id: Optional[str] = None, day: Optional[str] = None) -> float:
+        """Estimated USD spent by one run and/or on one day (YYYY-MM-DD)."""
+        where, params = self._where(run_id=run_id, day=day)
+        with self._lock:
+            return self._conn.execute(f"SELECT COALESCE(SUM(cost_usd), 0) FROM calls{where}", params).fetchone()[0]
+
+    def rollup(self, by: str = "day", days: Optional[int] = None, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Totals grouped by day, feature, model, item or run_id, most expensive first."""
+        if by not in ROLLUP_KEYS:
+            raise ValueError(f"rollup by must be one of {ROLLUP_KEYS}, got {by!r}")
+        since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d") if days else None
+        where, params = self._where(run_id=run_id, since=since)
+        sql = f"""
+            SELECT {by} AS key, COUNT(*) AS calls,
+                   SUM(outcome = 'cache_hit') AS cache_hits, SUM(outcome = 'error') AS errors,
+                   SUM(prompt_tokens) AS prompt_tokens, SUM(cached_tokens) AS cached_tokens,
+                   SUM(completion_tokens) AS completion_tokens,
+                   ROUND(SUM(latency_s), 3) AS latency_s, SUM(cost_usd) AS cost_usd
+            FROM calls{where} GROUP BY {by} ORDER BY cost_usd DESC, calls DESC
+        """
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _where(run_id: Optional[str] = None, day: Optional[str] = None,
+               since: Optional[str] = None) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if run_id:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        if day:
+            clauses.append("day = ?")
+            params.append(day)
+        if since:
+            clauses.append("day >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class UsageBudget:
+    """
+    Spending cap for one run and/or one day, in estimated USD (0 / None = no cap).
+    Callers reserve() a call's estimated cost before making it and skip the call when
+    that is refused, then settle() once the call's actual cost is in the ledger.
+    Reservations are counted as spent, so concurrent callers can't all slip under
+    the cap at once.
+    """
+
+    def __init__(self, ledger: Optional[UsageLedger], run_id: str, run_usd: Optional[float] = None,
+                 daily_usd: Optional[float] = None):
+        self.ledger = ledger
+        self.run_id = run_id
+        self.run_usd = run_usd or None
+        self.daily_usd = daily_usd or None
+        self._lock = threading.Lock()
+        self._reserved = 0.0
+
+    def reserve(self, estimated_usd: float = 0.0) -> bool:
+        """Sets `estimated_usd` aside if it fits under every cap; False (nothing reserved) if not."""
+        if self.ledger is None:
+            return True
+        with self._lock:
+            pending = self._reserved + estimated_usd
+            if self.run_usd and self.ledger.spent(run_id=self.run_id) + pending > self.run_usd:
+                return False
+            if self.daily_usd:
+                today = datetime.now().strftime("%Y-%m-%d")
+                if self.ledger.spent(day=today) + pending > self.daily_usd:
+                    return False
+            self._reserved = pending
+            return True
+
+    def settle(self, estimated_usd: float = 0.0) -> None:
+        """Releases a reservation; the call's actual cost has been recorded by then."""
+        if self.ledger is None:
+            return
+        with self._lock:
+            self._reserved = max(0.0, self._reserved - estimated_usd)
+
+
+_shared_ledger: Optional[UsageLedger] = None
+_shared_lock = threading.Lock()
+
+
+def get_usage_ledger() -> Optional[UsageLedger]:
+    """Process-wide ledger shared by every engine; LLM_LEDGER=0 disables it."""
+    global _shared_ledger
+    if os.getenv("LLM_LEDGER", "1").lower() in ("0", "false", "off"):
+        return None
+    with _shared_lock:
+        if _shared_ledger is None:
+            _shared_ledger = UsageLedger()
+        return _shared_ledger
+
+
+def format_rollup(rows: List[Dict[str, Any]], title: str) -> str:
+    lines = [title, f"  {'':<28} {'calls':>6} {'hits':>5} {'prompt':>9} {'cached':>9} {'compl':>8} {'secs':>8} {'usd':>9}"]
+    for r in rows:
+        lines.append(
+            f"  {str(r['key'] or '-')[:28]:<28} {r['calls']:>6} {r['cache_hits']:>5} {r['prompt_tokens']:>9} "
+            f"{r['cached_tokens']:>9} {r['completion_tokens']:>8} {r['latency_s']:>8.1f} {r['cost_usd']:>9.4f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LLM token / cost rollups from outputs/cache/llm_usage.db")
+    parser.add_argument("--by", default="day,feature", help=f"comma-separated, any of {', '.join(ROLLUP_KEYS)}")
+    parser.add_argument("--days", type=int, default=7, help="look back this many days (0 = all)")
+    parser.add_argument("--run-id", default=None)
+    args = parser.parse_args()
+
+    ledger = UsageLedger()
+    for key in [k.strip() for k in args.by.split(",") if k.strip()]:
+        print(format_rollup(ledger.rollup(key, days=args.days or None, run_id=args.run_id), f"By {key}:"))
@@ -2,39 +2,49 @@ import os
 import json
 import logging
 from typing import List, Dict, Any, Optional
-from openai import OpenAI
 from datetime import datetime
+from core.writers.llm_client import LLMClient, create_openai_client
+from core.utils.dedup import get_dedup_index
 
 logger = logging.getLogger(__name__)
 
+# Bump a version whenever its prompt template changes, so cached responses are not reused
+PROMPT_VERSIONS = {
+    "news_digest": "v2",
+    "podcast_digest": "v1",
+}
+
 class DigestEngine:
     """
     Generates AI-powered digests/summaries for news feeds.
     降维引擎: 把 N 条新闻压缩成核心要点。
     """
     
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
         api_key = os.getenv('DEEPSEEK_API_KEY')
         if not api_key:
             raise ValueError("Missing DEEPSEEK_API_KEY environment variable")
         
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.deepseek.com"
-        )
+        self.client = create_openai_client(api_key, base_url)
         self.model = "deepseek-chat"
+        self.llm = LLMClient(self.client)
     
-    def generate_news_digest(self, news_items: List[Dict[str, Any]], max_items: int = 15) -> str:
+    def generate_news_digest(self, news_items: List[Dict[str, Any]], max_items: int = 15,
+                             use_cache: bool = True) -> str:
         """
         Takes a list of news items and generates a concise Chinese digest.
         """
         if not news_items:
             return "暂无新闻数据，请先抓取 News Feed。"
         
+        # Collapse copies of the same story first, so max_items are all distinct stories
+        news_items = get_dedup_index().dedupe(news_items)
+
         # Prepare context for LLM
         news_text = ""
         for i, item in enumerate(news_items[:max_items]):
-            news_text += f"{i+1}. [{item.get('source', 'Unknown')}] {item.get('title', 'No Title')}\n"
+            coverage = f" (另有 {len(item['duplicates'])} 个来源报道)" if item.get('duplicates') else ""
+            news_text += f"{i+1}. [{item.get('source', 'Unknown')}] {item.get('title', 'No Title')}{coverage}\n"
             news_text += f"   {item.get('summary', '')[:150]}\n\n"
         
         today = datetime.now().strftime("%Y-%m-%d")
@@ -56,21 +66,23 @@ class DigestEngine:
 """
 
         try:
-            response = self.client.chat.completions.create(
+            return self.llm.chat(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a concise AI industry analyst."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=800,
-                temperature=0.5
+                temperature=0.5,
+                template_version=PROMPT_VERSIONS["news_digest"], use_cache=use_cache,
+                feature="news_digest"
             )
-            return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Digest generation failed: {e}")
             return f"Digest 生成失败: {e}"
 
-    def generate_podcast_digest(self, episodes: List[Dict[str, Any]], max_items: int = 5) -> str:
+    def generate_podcast_digest(self, episodes: List[Dict[str, Any]], max_items: int = 5,
+                                use_cache: bool = True) -> str:
         """
         Summarizes podcast episodes into key takeaways.
         """
@@ -97,16 +109,17 @@ class DigestEngine:
 请输出本周对话精华:
 """
         try:
-            response = self.client.chat.completions.create(
+            return self.llm.chat(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a podcast summarizer."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=600,
-                temperature=0.5
+                temperature=0.5,
+                template_version=PROMPT_VERSIONS["podcast_digest"], use_cache=use_cache,
+                feature="podcast_digest"
             )
-            return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Podcast digest failed: {e}")
             return f"Podcast Digest 生成失败: {e}"
@@ -1,26 +1,42 @@
-from openai import OpenAI
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 from dotenv import load_dotenv
+from core.utils.json_stream import JSONSectionParser
+from core.writers.llm_client import LLMClient, create_openai_client
+from core.utils.usage_ledger import usage_scope
 
 load_dotenv()
 
+# Bump a version whenever its prompt template changes, so cached responses are not reused
+PROMPT_VERSIONS = {
+    "analyze_paper": "v1",
+    "deep_dive": "v2",
+    "technical_learning": "v1",
+}
+
+
+def _paper_key(paper: Dict[str, Any]) -> str:
+    # ArXiv ID when there is one (the item store's key), so usage rolls up per paper
+    return (paper.get('url') or '').rstrip('/').split('/')[-1] or paper.get('title', '')
+
+
 class InsightEngine:
     """
     升维引擎 v2: Structured Referee Report (NeurIPS-style Checklist)
     """
     
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
-        self.base_url = "https://api.deepseek.com"
         
         if not self.api_key:
             raise ValueError("DEEPSEEK_API_KEY not found in .env")
 
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self.client = create_openai_client(self.api_key, base_url)
+        self.base_url = str(self.client.base_url)
+        self.llm = LLMClient(self.client)
 
-    def analyze_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_paper(self, paper: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
         """Quick scan (unchanged)."""
         prompt = f"""
         You are a Senior AI Researcher. Briefly analyze this paper.
@@ -37,21 +53,52 @@ class InsightEngine:
         }}
         """
         try:
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3, max_tokens=300
-            )
-            return json.loads(response.choices[0].message.content)
+            with usage_scope(item=_paper_key(paper)):
+                content = self.llm.chat(
+                    model="deepseek-chat",
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"},
+                    temperature=0.3, max_tokens=300,
+                    template_version=PROMPT_VERSIONS["analyze_paper"], use_cache=use_cache,
+                    feature="analyze_paper"
+                )
+            return json.loads(content)
         except Exception as e:
             return {"error": str(e), "verdict": "ERROR"}
 
-    def deep_dive(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def deep_dive(self, paper: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
         """
         升维分析 v2: Structured Referee Report
         Aligned with NeurIPS ML Reproducibility Checklist
         """
+        try:
+            with usage_scope(item=_paper_key(paper)):
+                content = self.llm.chat(**self._deep_dive_request(paper), use_cache=use_cache)
+            return json.loads(content)
+        except Exception as e:
+            return {"error": str(e)}
+
+    def deep_dive_stream(self, paper: Dict[str, Any], use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming deep_dive: yields the report as it grows, once per completed
+        top-level section (meta, contribution, methodology, ...).
+        The last value yielded is the full report, or {"error": ...}.
+        """
+        parser = JSONSectionParser()
+        report: Dict[str, Any] = {}
+        try:
+            for chunk in self.llm.chat_stream(**self._deep_dive_request(paper), use_cache=use_cache,
+                                              scope={"item": _paper_key(paper)}):
+                sections = parser.feed(chunk)
+                if sections:
+                    report.update(sections)
+                    yield dict(report)
+            # Whatever the incremental parser could not close gets one strict parse at the end
+            yield json.loads(parser.text)
+        except Exception as e:
+            yield {"error": str(e)}
+
+    def _deep_dive_request(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         github_info = f"GitHub: {paper.get('links', {}).get('github', '无')}"
         
         prompt = f"""
@@ -171,27 +218,41 @@ class InsightEngine:
     }}
 }}
 """
+        return dict(
+            model="deepseek-chat",
+            messages=[
+                {"role": "system", "content": "你是一位严谨的 ML Reviewer，按 NeurIPS checklist 标准输出结构化评审。"},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            max_tokens=2000,
+            template_version=PROMPT_VERSIONS["deep_dive"],
+            feature="deep_dive",
+        )
 
+    def technical_learning(self, paper: Dict[str, Any], use_cache: bool = True) -> str:
+        """
+        技术学习型解读: 专注于 "我能学到什么" 和 "值不值得复现"
+        返回 Markdown 格式的详细分析
+        """
         try:
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[
-                    {"role": "system", "content": "你是一位严谨的 ML Reviewer，按 NeurIPS checklist 标准输出结构化评审。"},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-                max_tokens=2000
-            )
-            return json.loads(response.choices[0].message.content)
+            with usage_scope(item=_paper_key(paper)):
+                return self.llm.chat(**self._technical_learning_request(paper), use_cache=use_cache)
         except Exception as e:
-            return {"error": str(e)}
+            return f"**Error**: {str(e)}"
 
-    def technical_learning(self, paper: Dict[str, Any]) -> str:
+    def technical_learning_stream(self, paper: Dict[str, Any], use_cache: bool = True) -> Iterator[str]:
         """
-        技术学习型解读: 专注于 "我能学到什么" 和 "值不值得复现"
-        返回 Markdown 格式的详细分析
+        Streaming technical_learning: yields Markdown chunks as they arrive.
         """
+        try:
+            yield from self.llm.chat_stream(**self._technical_learning_request(paper), use_cache=use_cache,
+                                            scope={"item": _paper_key(paper)})
+        except Exception as e:
+            yield f"\n\n**Error**: {str(e)}"
+
+    def _technical_learning_request(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         github_info = f"GitHub: {paper.get('links', {}).get('github', '无')}"
         
         system_prompt = """你是一名在机器学习与大模型方向有多年经验的研究员和代码实现者。
@@ -238,20 +299,17 @@ class InsightEngine:
 - **工程实践建议**：适合什么场景试验 + 落地需注意的细节
 - **综合判断**：「建议亲自复现 / 建议只读懂思路不必复现 / 建议当作背景阅读」+ 理由
 """
-
-        try:
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.4,
-                max_tokens=2500
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            return f"**Error**: {str(e)}"
+        return dict(
+            model="deepseek-chat",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.4,
+            max_tokens=2500,
+            template_version=PROMPT_VERSIONS["technical_learning"],
+            feature="technical_learning",
+        )
 
 
 if __name__ == "__main__":
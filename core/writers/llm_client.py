@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional
+from openai import OpenAI
+from core.utils.response_cache import ResponseCache, get_response_cache
+from core.utils.tracing import span
+from core.utils.usage_ledger import UsageLedger, current_scope, get_usage_ledger
+from core.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.deepseek.com"
+
+LLM_CALLS = metrics.counter("radar_llm_calls_total", "Chat completions by feature and outcome", ["feature", "outcome"])
+LLM_SECONDS = metrics.histogram("radar_llm_latency_seconds", "Chat completion latency (cache misses only)", ["feature"])
+LLM_TOKENS = metrics.counter("radar_llm_tokens_total", "Tokens reported by the API", ["feature", "kind"])
+LLM_COST = metrics.counter("radar_llm_cost_usd_total", "Estimated spend (see core/utils/usage_ledger.py)", ["feature"])
+
+
+def create_openai_client(api_key: str, base_url: Optional[str] = None) -> OpenAI:
+    """
+    DeepSeek by default; LLM_BASE_URL points the engines at any OpenAI-compatible
+    server (e.g. benchmarks/llm_stub.py). LLM_TIMEOUT / LLM_MAX_RETRIES override
+    the SDK's request timeout (seconds) and retry count.
+    """
+    options: Dict[str, Any] = {}
+    if os.getenv("LLM_TIMEOUT"):
+        options["timeout"] = float(os.getenv("LLM_TIMEOUT"))
+    if os.getenv("LLM_MAX_RETRIES"):
+        options["max_retries"] = int(os.getenv("LLM_MAX_RETRIES"))
+    return OpenAI(api_key=api_key, base_url=base_url or os.getenv("LLM_BASE_URL") or DEFAULT_BASE_URL, **options)
+
+
+class LLMClient:
+    """
+    Chat-completions call path shared by InsightEngine and DigestEngine.
+    Responses are cached by (model, prompt template version, rendered messages,
+    temperature, max_tokens, response_format). use_cache=False bypasses the lookup
+    but still stores the fresh response, i.e. it forces a refresh.
+    Every call (cache hits included) is recorded in the usage ledger under its feature.
+    """
+
+    def __init__(self, client: OpenAI, cache: Optional[ResponseCache] = None,
+                 ledger: Optional[UsageLedger] = None):
+        self.client = client
+        self.cache = cache if cache is not None else get_response_cache()
+        self.ledger = ledger if ledger is not None else get_usage_ledger()
+
+    def _cache_key(self, messages: List[Dict[str, str]], model: str, temperature: float, max_tokens: int,
+                   template_version: str, response_format: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not self.cache:
+            return None
+        return ResponseCache.make_key(
+            model=model, template_version=template_version, messages=messages,
+            temperature=temperature, max_tokens=max_tokens, response_format=response_format,
+        )
+
+    @staticmethod
+    def _params(messages, model, temperature, max_tokens, response_format) -> Dict[str, Any]:
+        params = dict(model=model, messages=messages, temperature=temperature, max_tokens=max_tokens)
+        if response_format:
+            params["response_format"] = response_format
+        return params
+
+    def _record(self, feature: str, model: str, outcome: str, usage: Optional[Dict[str, Any]] = None,
+                seconds: float = 0.0, scope: Optional[Dict[str, str]] = None) -> None:
+        LLM_CALLS.inc(feature=feature, outcome=outcome)
+        if outcome == "ok":
+            LLM_SECONDS.observe(seconds, feature=feature)
+            for kind, tokens in (usage or {}).items():
+                LLM_TOKENS.inc(tokens or 0, feature=feature, kind=kind.replace("_tokens", ""))
+        if self.ledger is None:
+            return
+        try:
+            LLM_COST.inc(self.ledger.record(feature, model, outcome, usage, seconds, scope), feature=feature)
+        except Exception as e:
+            # Accounting must never fail the call it accounts for
+            logger.warning(f"Usage ledger write failed: {e}")
+
+    def chat(self, messages: List[Dict[str, str]], model: str, temperature: float, max_tokens: int,
+             template_version: str, response_format: Optional[Dict[str, Any]] = None,
+             use_cache: bool = True, feature: str = "chat") -> str:
+        with span("llm.chat", "llm", model=model, feature=feature) as s:
+            key = self._cache_key(messages, model, temperature, max_tokens, template_version, response_format)
+            if key and use_cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    s.set(outcome="cache_hit", bytes=len(cached))
+                    self._record(feature, model, "cache_hit")
+                    return cached
+
+            start = time.perf_counter()
+            try:
+                response = self.client.chat.completions.create(
+                    **self._params(messages, model, temperature, max_tokens, response_format)
+                )
+            except Exception:
+                self._record(feature, model, "error", seconds=time.perf_counter() - start)
+                raise
+            content = response.choices[0].message.content
+            usage = _usage(response)
+            s.set(outcome="ok", bytes=len(content or ""), **usage)
+            self._record(feature, model, "ok", usage, time.perf_counter() - start)
+
+            if key and content and _cacheable(content, response_format):
+                self.cache.set(key, content)
+            return content
+
+    def chat_stream(self, messages: List[Dict[str, str]], model: str, temperature: float, max_tokens: int,
+                    template_version: str, response_format: Optional[Dict[str, Any]] = None,
+                    use_cache: bool = True, feature: str = "chat",
+                    scope: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """
+        Same as chat(), but yields content chunks as they arrive.
+        A cache hit is yielded as a single chunk; a complete stream is cached under
+        the same key as chat(), so either variant can serve the other.
+        Usage is tagged with the usage_scope current when the stream starts plus
+        `scope`; don't wrap the iteration in usage_scope, since it would stay set
+        in the consumer's code between chunks.
+        """
+        scope = {**current_scope(), **{k: v for k, v in (scope or {}).items() if v}}
+        with span("llm.chat_stream", "llm", model=model, feature=feature) as s:
+            key = self._cache_key(messages, model, temperature, max_tokens, template_version, response_format)
+            if key and use_cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    s.set(outcome="cache_hit", bytes=len(cached))
+                    self._record(feature, model, "cache_hit", scope=scope)
+                    yield cached
+                    return
+
+            start = time.perf_counter()
+            parts = []
+            usage: Dict[str, Any] = {}
+            try:
+                stream = self.client.chat.completions.create(
+                    **self._params(messages, model, temperature, max_tokens, response_format), stream=True,
+                    stream_options={"include_usage": True},
+                )
+                for chunk in stream:
+                    # Servers that report usage on a stream send it with the final chunk
+                    usage = _usage(chunk) or usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            except Exception:
+                self._record(feature, model, "error", seconds=time.perf_counter() - start, scope=scope)
+                raise
+
+            content = "".join(parts)
+            s.set(outcome="ok", bytes=len(content), **usage)
+            self._record(feature, model, "ok", usage, time.perf_counter() - start, scope)
+            if key and content and _cacheable(content, response_format):
+                self.cache.set(key, content)
+
+
+def _usage(response) -> Dict[str, Any]:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return {}
+    # Prompt-cache hits: DeepSeek reports prompt_cache_hit_tokens, OpenAI prompt_tokens_details.cached_tokens
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(usage, "prompt_cache_hit_tokens", None) or getattr(details, "cached_tokens", None) or 0
+    return {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens,
+            "cached_tokens": cached}
+
+
+def _cacheable(content: str, response_format: Optional[Dict[str, Any]]) -> bool:
+    # Never pin a malformed JSON answer in the cache; the next call should retry
+    if response_format and response_format.get("type") == "json_object":
+        try:
+            json.loads(content)
+        except ValueError:
+            return False
+    return True
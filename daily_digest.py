@@ -1,17 +1,80 @@
+import contextvars
 import os
-import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from core.miners.arxiv_miner import ArxivMiner
 from core.miners.news_miner import NewsMiner
+from core.miners.section_feeds import DEDUP_SECTIONS
 from core.writers.insight_engine import InsightEngine
 from core.utils.config_loader import ConfigLoader
+from core.utils.item_store import get_item_store
+from core.utils.dedup import get_dedup_index
+from core.utils.rate_limit import RateLimiter
+from core.utils.pipeline import Pipeline
+from core.utils.tracing import get_tracer, span
+from core.utils.metrics import get_registry, start_metrics_server
+from core.utils.usage_ledger import UsageBudget, current_scope, estimate_cost, format_rollup, get_usage_ledger, usage_scope
 
-def generate_daily_digest():
+# LLM concurrency and provider limits (0 = unlimited)
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "4"))
+LLM_RPM = float(os.getenv("LLM_RPM", "60"))
+LLM_TPM = float(os.getenv("LLM_TPM", "0"))
+
+# Estimated LLM spend caps in USD (0 = unlimited). Once reached, the top papers
+# not analysed yet are listed without an AI analysis.
+LLM_BUDGET_USD = float(os.getenv("LLM_BUDGET_USD", "0"))
+LLM_DAILY_BUDGET_USD = float(os.getenv("LLM_DAILY_BUDGET_USD", "0"))
+
+# RADAR_TRACE=1 writes a Chrome / Perfetto trace of every run to outputs/traces/
+TRACE = os.getenv("RADAR_TRACE", "0").lower() in ("1", "true", "on")
+
+# Counters / latency histograms of the run, in Prometheus text format
+# (also served live on RADAR_METRICS_PORT while the run is going)
+METRICS_FILE = os.getenv("RADAR_METRICS_FILE", "outputs/metrics.prom")
+
+def _estimate_tokens(paper) -> int:
+    # analyze_paper prompt (~4 chars per token) + its max_tokens budget
+    prompt_chars = 400 + len(paper['title']) + len(paper['abstract'][:500]) + 20 * len(paper['authors'][:5])
+    return prompt_chars // 4 + 300
+
+def generate_daily_digest(max_papers: int = 5, max_in_flight: int = LLM_MAX_IN_FLIGHT,
+                          rpm: float = LLM_RPM, tpm: float = LLM_TPM, trace: bool = TRACE):
+    start_metrics_server()
+    run_id = f"digest_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    try:
+        with usage_scope(run_id=run_id):
+            return _traced_digest(max_papers, max_in_flight, rpm, tpm, trace)
+    finally:
+        print(f"📈 Metrics: {get_registry().write(METRICS_FILE)}")
+        ledger = get_usage_ledger()
+        if ledger:
+            print(format_rollup(ledger.rollup("feature", run_id=run_id), f"💰 LLM usage ({run_id}):"))
+
+def _traced_digest(max_papers: int, max_in_flight: int, rpm: float, tpm: float, trace: bool):
+    tracer = get_tracer()
+    if not trace:
+        return _run_digest(max_papers, max_in_flight, rpm, tpm)
+
+    tracer.start()
+    try:
+        with span("daily_digest"):
+            return _run_digest(max_papers, max_in_flight, rpm, tpm)
+    finally:
+        tracer.stop()
+        path = tracer.save(f"outputs/traces/trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        slowest = sorted(tracer.summary().items(), key=lambda kv: kv[1]["wall_s"], reverse=True)[:8]
+        print(f"🧭 Trace: {path}")
+        for name, t in slowest:
+            print(f"   {name:<18} x{t['count']:<4} wall {t['wall_s']:.2f}s  cpu {t['cpu_s']:.2f}s")
+
+def _run_digest(max_papers: int, max_in_flight: int, rpm: float, tpm: float):
     print("🚀 Starting Daily AI Trend Radar...")
     
     # 1. Setup
     config = ConfigLoader()
-    arxiv = ArxivMiner(config)
+    store = get_item_store()
+    arxiv = ArxivMiner(config, store=store)
     news = NewsMiner(config)
     
     try:
@@ -21,61 +84,137 @@ def generate_daily_digest():
         insight = None
         print("⚠️ AI Analyst Offline (Using passive mode)")
 
-    # 2. Fetch Content
-    # A. Papers
-    papers = arxiv.fetch_latest_papers(max_results=50)
-    top_papers = [p for p in papers if p['hype_score'] >= 40][:5] 
-    
-    # Analyze Top Papers
-    analyzed_papers = []
-    for p in top_papers:
-        # Fix: Convert datetime to string for JSON serialization
-        if hasattr(p.get('published'), 'isoformat'):
-            p['published'] = p['published'].isoformat()
-            
-        if insight:
-             print(f"Analyzing: {p['title']}...")
-             analysis = insight.analyze_paper(p)
-
-             if isinstance(analysis, str):
-                 p['ai_analysis'] = {'verdict': 'N/A', 'tldr': analysis}
-             else:
-                 p['ai_analysis'] = analysis
-        analyzed_papers.append(p)
-    
-    # B. Official Blogs
-    official_news = news.fetch_by_category("official", max_items=10)
+    # 2. Run the stages as a dependency graph: news feeds are fetched while papers are
+    # scored and analysed, and each top paper goes to the analyst as soon as its place
+    # in the top list is certain (before the remaining papers finish scoring).
+    top_queue = queue.Queue()
+    limiter = RateLimiter(rpm=rpm or None, tpm=tpm or None)
+    budget = UsageBudget(get_usage_ledger(), current_scope().get("run_id"), LLM_BUDGET_USD, LLM_DAILY_BUDGET_USD)
+    output_dir = "outputs"
+    md_filename = f"{output_dir}/briefing_{datetime.now().strftime('%Y%m%d')}.md"
 
-    # C. Media & Newsletters
-    media_news = news.fetch_by_category("media", max_items=10)
+    def fetch_arxiv():
+        try:
+            return arxiv.fetch_latest_papers(max_results=50, top_n=max_papers, min_score=40, on_top=top_queue.put)
+        finally:
+            top_queue.put(None)
 
-    # D. Tools & Vibe Coding (NEW)
-    tool_news = news.fetch_by_category("tools", max_items=10)
+    def save_papers(fetch_arxiv):
+        store.upsert_papers(fetch_arxiv)
 
-    # 3. Create Structured Data
-    digest_data = {
-        "date": datetime.now().strftime('%Y-%m-%d'),
-        "hype_papers": analyzed_papers,
-        "official_news": official_news,
-        "media_news": media_news,
-        "tool_news": tool_news
-    }
+    def analyze():
+        return _analyze_top_papers(top_queue, insight, store, max_in_flight, limiter, budget)
 
-    # 4. Save
-    output_dir = "outputs"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Save JSON (Source of Truth for App)
-    json_filename = f"{output_dir}/digest_{datetime.now().strftime('%Y%m%d')}.json"
-    with open(json_filename, "w", encoding='utf-8') as f:
-        json.dump(digest_data, f, ensure_ascii=False, indent=2)
+    def fetch_news(category):
+        return lambda: news.fetch_by_category(category, max_items=10)
 
-    # Save Markdown (Backup / Human Readability)
-    md_filename = f"{output_dir}/briefing_{datetime.now().strftime('%Y%m%d')}.md"
-    _save_markdown(digest_data, md_filename)
-        
-    print(f"✅ Briefing generated: {json_filename} & {md_filename}")
-    return json_filename
+    def dedup(news_official, news_media, news_tools):
+        # A story covered by an official blog and the media is listed once, under the earlier category.
+        # The stored page sections (news, products, HN / Reddit) only add "also" entries to it.
+        pages = [store.latest_feed_items(s) for s in DEDUP_SECTIONS]
+        return get_dedup_index().dedupe_groups([news_official, news_media, news_tools] + pages)[:3]
+
+    def save_digest(fetch_arxiv, save_papers, analyze, dedup):
+        top_papers = [p for p in fetch_arxiv if p['hype_score'] >= 40][:max_papers]
+        for p in top_papers:
+            # Fix: Convert datetime to string for JSON serialization
+            if hasattr(p.get('published'), 'isoformat'):
+                p['published'] = p['published'].isoformat()
+            if _paper_id(p) in analyze:
+                p['ai_analysis'] = analyze[_paper_id(p)]
+
+        official_news, media_news, tool_news = dedup
+        digest_data = {
+            "date": datetime.now().strftime('%Y-%m-%d'),
+            "hype_papers": top_papers,
+            "official_news": official_news,
+            "media_news": media_news,
+            "tool_news": tool_news
+        }
+        # Save to the item store (Source of Truth for App)
+        store.save_daily_digest(digest_data['date'], digest_data)
+        return digest_data
+
+    def render_markdown(save_digest):
+        # Save Markdown (Backup / Human Readability)
+        os.makedirs(output_dir, exist_ok=True)
+        _save_markdown(save_digest, md_filename)
+
+    pipeline = Pipeline("digest")
+    pipeline.add("fetch_arxiv", fetch_arxiv)
+    pipeline.add("save_papers", save_papers, ["fetch_arxiv"])
+    pipeline.add("analyze", analyze)
+    for category in ("official", "media", "tools"):
+        pipeline.add(f"news_{category}", fetch_news(category))
+    pipeline.add("dedup", dedup, ["news_official", "news_media", "news_tools"])
+    pipeline.add("save_digest", save_digest, ["fetch_arxiv", "save_papers", "analyze", "dedup"])
+    pipeline.add("render_markdown", render_markdown, ["save_digest"])
+
+    try:
+        digest_data = pipeline.run()["save_digest"]
+    finally:
+        print(f"⏱️ Stages:\n{pipeline.report()}")
+
+    print(f"✅ Briefing generated: {store.path} ({digest_data['date']}) & {md_filename}")
+    return digest_data['date']
+
+def _analyze_top_papers(top_queue, insight, store, max_in_flight, limiter, budget):
+    """
+    Takes papers off `top_queue` (None ends it) as the miner confirms them.
+    Analyses stored by an earlier run are reused; the rest go to the analyst,
+    max_in_flight at once, throttled to the provider's RPM/TPM.
+    Returns {paper_id: analysis}.
+    """
+    analyses = {}
+    pending = {}
+
+    def analyze(p):
+        # Budget first: a skipped call must not take RPM / TPM tokens from the other workers.
+        # The estimate stays reserved until the call's real cost is in the ledger.
+        # Papers are analysed in the order their top-N place became certain, several at a
+        # time, so once the budget runs out it is the last-confirmed papers that go without.
+        estimate = estimate_cost("deepseek-chat", _estimate_tokens(p) - 300, 300)
+        if not budget.reserve(estimate):
+            return None
+        try:
+            limiter.acquire(_estimate_tokens(p))
+            return insight.analyze_paper(p)
+        finally:
+            budget.settle(estimate)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix="analyze") as pool:
+        while True:
+            p = top_queue.get()
+            if p is None:
+                break
+            stored_analysis = store.get_analysis(_paper_id(p), "quick")
+            if stored_analysis:
+                # Already analysed by an earlier run
+                analyses[_paper_id(p)] = stored_analysis
+            elif insight:
+                pending[_paper_id(p)] = pool.submit(contextvars.copy_context().run, analyze, p)
+
+    skipped = 0
+    for paper_id, future in pending.items():
+        analysis = future.result()
+        if analysis is None:
+            skipped += 1
+            continue
+        if isinstance(analysis, str):
+            analysis = {'verdict': 'N/A', 'tldr': analysis}
+        analyses[paper_id] = analysis
+        if analysis.get('verdict') != 'ERROR':
+            store.save_analysis(paper_id, "quick", analysis)
+
+    print(f"Analyzed {len(pending) - skipped} papers ({max_in_flight} in flight), "
+          f"{len(analyses) - len(pending) + skipped} reused from earlier runs")
+    if skipped:
+        print(f"💸 LLM budget reached: {skipped} top papers left without analysis")
+    return analyses
+
+def _paper_id(paper) -> str:
+    # ArXiv ID, same key the Research page uses for analyses
+    return paper['url'].split('/')[-1]
 
 def _save_markdown(data, filename):
     md = f"# 📡 Daily AI Trend Radar ({data['date']})\n\n"
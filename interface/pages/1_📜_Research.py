@@ -6,10 +6,10 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core.miners.arxiv_miner import ArxivMiner
+from core.miners.refresh import refresh_now
 from core.writers.insight_engine import InsightEngine
-from core.utils.config_loader import ConfigLoader
-from interface.ui_utils import apply_styles, load_data, save_data, last_updated_component
+from interface.ui_utils import (apply_styles, get_config_loader, REFRESH_RUNNING, load_channels, load_data, save_data,
+                                save_analysis, last_updated_component, filter_items, paginate, item_fragments)
 
 st.set_page_config(page_title="Research Radar", page_icon="📜", layout="wide")
 apply_styles()
@@ -154,24 +154,19 @@ with st.sidebar:
     if st.button("🔄 Scan ArXiv Now", type="primary"):
         with st.spinner("Fetching ArXiv..."):
             try:
-                config = ConfigLoader()
-                miner = ArxivMiner(config)
-                papers = miner.fetch_latest_papers(max_results=80)
-                top_papers = [p for p in papers if p['hype_score'] >= 20]
-                for p in top_papers:
-                    if hasattr(p.get('published'), 'isoformat'):
-                        p['published'] = p['published'].isoformat()
-                save_data("papers_latest.json", top_papers)
-                st.success(f"Found {len(top_papers)} papers!")
-                time.sleep(1)
-                st.rerun()
+                count = refresh_now("papers", get_config_loader())
+                if count is None:
+                    st.info(REFRESH_RUNNING)
+                else:
+                    st.success(f"Found {count} papers!")
+                    time.sleep(1)
+                    st.rerun()
             except Exception as e:
                 st.error(f"Error: {e}")
 
     st.markdown("---")
     st.header("📡 Radar Channels")
-    config_loader = ConfigLoader()
-    channels = config_loader.load_channels()
+    channels = load_channels()
     channel_names = ["All Channels"] + [c.name for c in channels]
     selected_channel = st.radio("Focus Area:", channel_names)
 
@@ -181,66 +176,85 @@ last_updated_component("papers_latest.json")
 all_analyses = load_data("paper_analyses.json") or {}
 
 # --- Display Papers ---
+def paper_card(p):
+    score = p['hype_score']
+    color = "#FF4444" if score >= 80 else "#FF8800" if score >= 50 else "#4488FF"
+    return f"""
+    <div style="border-left: 4px solid {color}; padding: 10px 15px; margin-bottom:4px; background-color: #262730; border-radius: 5px;">
+        <h4><span style="color:{color}">[{score}]</span> <a href="{p['url']}" target="_blank" style="color:white;">{p['title']}</a></h4>
+        <p style="color:#888; font-size:0.8em;">{' • '.join(p.get('signals', []))}</p>
+        <p style="color:#aaa; font-size:0.85em;">{p['abstract'][:200]}...</p>
+    </div>
+    """
+
 data = load_data("papers_latest.json")
 
 if not data:
     st.info("No data. Click 'Scan ArXiv Now'.")
 else:
-    filtered_data = data if selected_channel == "All Channels" else [p for p in data if selected_channel in p.get('channels', [])]
+    filtered = filter_items("papers_latest.json", "channels", None if selected_channel == "All Channels" else selected_channel)
 
-    if not filtered_data:
+    if not filtered:
         st.info(f"No papers in '{selected_channel}'.")
-    
-    for i, p in enumerate(filtered_data[:20]):
-        score = p['hype_score']
-        color = "#FF4444" if score >= 80 else "#FF8800" if score >= 50 else "#4488FF"
+    page = paginate(filtered, key=f"papers_{selected_channel}") if filtered else []
+
+    for i, html in zip(page, item_fragments("papers_latest.json", paper_card, page)):
+        p = data[i]
         paper_id = p['url'].split('/')[-1]  # Use ArXiv ID as key
         
         with st.container():
-            st.markdown(f"""
-            <div style="border-left: 4px solid {color}; padding: 10px 15px; margin-bottom:4px; background-color: #262730; border-radius: 5px;">
-                <h4><span style="color:{color}">[{score}]</span> <a href="{p['url']}" target="_blank" style="color:white;">{p['title']}</a></h4>
-                <p style="color:#888; font-size:0.8em;">{' • '.join(p.get('signals', []))}</p>
-                <p style="color:#aaa; font-size:0.85em;">{p['abstract'][:200]}...</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(html, unsafe_allow_html=True)
             
             # Action buttons row
             col1, col2, col3 = st.columns([1, 1, 1])
             
             with col1:
-                if st.button("📋 评审报告", key=f"ref_{i}"):
-                    with st.spinner("生成评审..."):
-                        try:
-                            engine = InsightEngine()
-                            analysis = engine.deep_dive(p)
-                            all_analyses[paper_id] = {"type": "referee", "data": analysis}
-                            save_data("paper_analyses.json", all_analyses)
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"{e}")
+                referee_clicked = st.button("📋 评审报告", key=f"ref_{paper_id}")
             
             with col2:
-                if st.button("📚 技术解读", key=f"learn_{i}"):
-                    with st.spinner("生成解读..."):
-                        try:
-                            engine = InsightEngine()
-                            result = engine.technical_learning(p)
-                            all_analyses[paper_id] = {"type": "learning", "data": result}
-                            save_data("paper_analyses.json", all_analyses)
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"{e}")
+                learn_clicked = st.button("📚 技术解读", key=f"learn_{paper_id}")
             
             with col3:
                 # Show "View Result" only if this paper has been analyzed
                 if paper_id in all_analyses:
                     analysis_info = all_analyses[paper_id]
                     label = "📋 查看报告" if analysis_info["type"] == "referee" else "📚 查看解读"
-                    if st.button(label, key=f"view_{i}"):
+                    if st.button(label, key=f"view_{paper_id}"):
                         st.session_state[f"show_{paper_id}"] = not st.session_state.get(f"show_{paper_id}", False)
                         st.rerun()
             
+            # Stream a fresh analysis full-width under the buttons; only the final result is saved
+            if referee_clicked:
+                try:
+                    engine = InsightEngine()
+                    with st.status("生成评审...", expanded=True) as status:
+                        analysis, shown = {}, set()
+                        for analysis in engine.deep_dive_stream(p):
+                            for section in [k for k in analysis if k not in shown]:
+                                shown.add(section)
+                                st.markdown(f"**✓ {section}**")
+                                st.json(analysis[section], expanded=False)
+                        failed = "error" in analysis
+                        status.update(label="评审失败" if failed else "评审完成", state="error" if failed else "complete")
+                    save_analysis(paper_id, "referee", analysis)
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"{e}")
+            
+            if learn_clicked:
+                try:
+                    engine = InsightEngine()
+                    placeholder = st.empty()
+                    result = ""
+                    for chunk in engine.technical_learning_stream(p):
+                        result += chunk
+                        placeholder.markdown(result + "▌")
+                    placeholder.markdown(result)
+                    save_analysis(paper_id, "learning", result)
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"{e}")
+            
             # Display analysis inline if toggled on
             if paper_id in all_analyses and st.session_state.get(f"show_{paper_id}", False):
                 analysis_info = all_analyses[paper_id]
@@ -249,7 +263,7 @@ else:
                     # Markdown display for technical learning
                     with st.expander("📚 技术学习型解读", expanded=True):
                         st.markdown(analysis_info["data"])
-                        if st.button("❌ 收起", key=f"close_{i}"):
+                        if st.button("❌ 收起", key=f"close_{paper_id}"):
                             st.session_state[f"show_{paper_id}"] = False
                             st.rerun()
                 else:
@@ -269,10 +283,10 @@ else:
                         
                         st.success(f"💎 {verd.get('key_takeaway', '')}")
                         
-                        if st.button("📖 查看完整报告", key=f"full_{i}"):
+                        if st.button("📖 查看完整报告", key=f"full_{paper_id}"):
                             save_data("deep_dive_current.json", d)
                             st.rerun()
                         
-                        if st.button("❌ 收起", key=f"closex_{i}"):
+                        if st.button("❌ 收起", key=f"closex_{paper_id}"):
                             st.session_state[f"show_{paper_id}"] = False
                             st.rerun()
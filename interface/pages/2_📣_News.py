@@ -1,14 +1,13 @@
 import streamlit as st
 import sys
 import time
-import feedparser
 from pathlib import Path
-from typing import List, Dict, Any
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from core.utils.config_loader import ConfigLoader
+from core.miners.refresh import refresh_now
 from core.writers.digest_engine import DigestEngine
-from interface.ui_utils import apply_styles, load_data, save_data, last_updated_component
+from interface.ui_utils import (apply_styles, get_config_loader, REFRESH_RUNNING, load_data, save_data, last_updated_component,
+                                filter_items, paginate, item_fragments)
 
 st.set_page_config(page_title="News Feed", page_icon="📣", layout="wide")
 apply_styles()
@@ -30,37 +29,19 @@ if digest_data and digest_data.get("content"):
         </div>
         """, unsafe_allow_html=True)
 
-def fetch_all_news(config: ConfigLoader, max_per_source: int = 5) -> List[Dict[str, Any]]:
-    cfg = config.load()
-    all_news = []
-    for feed in cfg.news_feeds:
-        try:
-            parsed = feedparser.parse(feed.url)
-            for entry in parsed.entries[:max_per_source]:
-                all_news.append({
-                    "source": feed.name,
-                    "type": feed.type or "unknown",
-                    "title": entry.title,
-                    "url": entry.link,
-                    "published": entry.get('published', 'N/A'),
-                    "summary": (entry.get('summary', '') or entry.get('description', ''))[:250] + "..."
-                })
-        except Exception as e:
-            st.warning(f"Could not fetch {feed.name}")
-    return all_news
-
 # Sidebar
 with st.sidebar:
     st.header("Actions")
     if st.button("📡 Fetch All News", type="primary"):
         with st.spinner("Scanning Official + Media + Newsletters..."):
             try:
-                config = ConfigLoader()
-                news = fetch_all_news(config, max_per_source=8)
-                save_data("news_feed.json", news)
-                st.success(f"Found {len(news)} articles!")
-                time.sleep(1)
-                st.rerun()
+                count = refresh_now("news", get_config_loader())
+                if count is None:
+                    st.info(REFRESH_RUNNING)
+                else:
+                    st.success(f"Found {count} articles!")
+                    time.sleep(1)
+                    st.rerun()
             except Exception as e:
                 st.error(f"Error: {e}")
     
@@ -94,22 +75,27 @@ with st.sidebar:
 last_updated_component("news_feed.json")
 
 # Display
+def news_card(n):
+    type_color = "#4CAF50" if n['type'] == 'official' else "#2196F3"
+    type_label = "🏢 Official" if n['type'] == 'official' else "📰 Media"
+    also = ", ".join(d['source'] for d in n.get('duplicates', []))
+    also_html = f" • also: {also}" if also else ""
+
+    return f"""
+    <div style="border-left: 4px solid {type_color}; padding: 10px 15px; margin-bottom:12px; background-color: #262730; border-radius: 5px;">
+        <div style="font-size:0.8em; color:#aaa;">{type_label} • {n['source']} • {n['published'][:16]}{also_html}</div>
+        <h4 style="margin:5px 0;"><a href="{n['url']}" target="_blank" style="color:white; text-decoration:none;">{n['title']}</a></h4>
+        <p style="color:#ccc; font-size:0.9em;">{n['summary']}</p>
+    </div>
+    """
+
 data = load_data("news_feed.json")
 
 if not data:
     st.info("No news yet. Click 'Fetch All News'.")
 else:
-    filtered = data if filter_type == "All" else [d for d in data if d.get('type') == filter_type]
-    
-    for n in filtered:
-        type_color = "#4CAF50" if n['type'] == 'official' else "#2196F3"
-        type_label = "🏢 Official" if n['type'] == 'official' else "📰 Media"
-        
-        st.markdown(f"""
-        <div style="border-left: 4px solid {type_color}; padding: 10px 15px; margin-bottom:12px; background-color: #262730; border-radius: 5px;">
-            <div style="font-size:0.8em; color:#aaa;">{type_label} • {n['source']} • {n['published'][:16]}</div>
-            <h4 style="margin:5px 0;"><a href="{n['url']}" target="_blank" style="color:white; text-decoration:none;">{n['title']}</a></h4>
-            <p style="color:#ccc; font-size:0.9em;">{n['summary']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    filtered = filter_items("news_feed.json", "type", None if filter_type == "All" else filter_type)
+    page = paginate(filtered, key=f"news_{filter_type}")
 
+    for html in item_fragments("news_feed.json", news_card, page):
+        st.markdown(html, unsafe_allow_html=True)
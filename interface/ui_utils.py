@@ -3,9 +3,32 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
+from core.utils.config_loader import ConfigLoader
+from core.utils.item_store import get_item_store
+from core.utils.metrics import start_metrics_server
+
+# Historical output file names -> store sections. Pages keep using the file names.
+FEED_SECTIONS = {
+    "news_feed.json": "news",
+    "discourse.json": "discourse",
+    "products.json": "products",
+    "podcasts.json": "podcasts",
+}
+DOCUMENT_KINDS = {
+    "news_digest.json": "news_digest",
+    "deep_dive_current.json": "deep_dive",
+}
+PAPERS_FILE = "papers_latest.json"
+ANALYSES_FILE = "paper_analyses.json"
+ANALYSIS_TYPES = ("referee", "learning")
+PAGE_SIZE = int(os.getenv("RADAR_PAGE_SIZE", "20"))
+PAGE_SIZES = (10, 20, 50, 100)
+REFRESH_RUNNING = "A refresh of this section is already running (refresh_daemon.py or another session); it shows up here when done."
 
 # Common visual styles
 def apply_styles():
+    # Every page calls this first; the /metrics endpoint (RADAR_METRICS_PORT) starts once per process
+    start_metrics_server()
     st.markdown("""
     <style>
         .card {
@@ -38,24 +61,187 @@ def apply_styles():
     </style>
     """, unsafe_allow_html=True)
 
-def load_data(filename):
+def _section(filename):
+    if filename == PAPERS_FILE:
+        return "papers"
+    return FEED_SECTIONS.get(filename) or DOCUMENT_KINDS.get(filename)
+
+def _load_from_store(filename):
+    store = get_item_store()
+    if filename == PAPERS_FILE:
+        return store.latest_papers() if store.latest_batch("papers") else None
+    if filename in FEED_SECTIONS:
+        section = FEED_SECTIONS[filename]
+        return store.latest_feed_items(section) if store.latest_batch(section) else None
+    if filename in DOCUMENT_KINDS:
+        return store.latest_document(DOCUMENT_KINDS[filename])
+    if filename == ANALYSES_FILE:
+        return store.all_analyses(ANALYSIS_TYPES) or None
+    return None
+
+def _load_json_file(filename):
     path = Path(f"outputs/{filename}")
     if path.exists():
         with open(path, "r") as f:
             return json.load(f)
     return None
 
+def _dataset(filename):
+    # Name the store versions the file's data under (see ItemStore.version)
+    return "analyses" if filename == ANALYSES_FILE else _section(filename)
+
+def _is_stored(filename):
+    return _dataset(filename) is not None
+
+def data_version(filename):
+    """
+    Cache key for a dataset: its store version, which only moves when that dataset
+    is written, or (mtime, size) for a plain JSON file.
+    """
+    if _is_stored(filename):
+        return get_item_store().version(_dataset(filename))
+    try:
+        stat = Path(f"outputs/{filename}").stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cached_data(filename, version):
+    return _read_data(filename)
+
+def load_data(filename):
+    """
+    Reads a dataset by its historical file name from the item store.
+    Legacy outputs/*.json files are imported into the store on first read.
+    Parsed results are shared by every rerun and session until the data changes
+    (see data_version), so treat them as read-only.
+    """
+    return _cached_data(filename, data_version(filename))
+
+def _read_data(filename):
+    if not _is_stored(filename):
+        return _load_json_file(filename)
+
+    data = _load_from_store(filename)
+    if data is None:
+        legacy = _load_json_file(filename)
+        if legacy is not None:
+            save_data(filename, legacy)
+            data = _load_from_store(filename)
+    return data
+
+def _matches(field_value, value):
+    if isinstance(field_value, (list, tuple)):
+        return value in field_value
+    return field_value == value
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _filtered(filename, version, field, value):
+    data = _cached_data(filename, version) or []
+    if field is None or value is None:
+        return list(range(len(data)))
+    return [i for i, item in enumerate(data) if _matches(item.get(field), value)]
+
+def filter_items(filename, field=None, value=None):
+    """
+    Positions in load_data(filename) of the items whose `field` equals `value`
+    (or contains it, for list fields); value None keeps everything. Cached per data version.
+    """
+    return _filtered(filename, data_version(filename), field, value)
+
+def paginate(positions, key, page_size=None):
+    """
+    Page controls for a filtered list; returns the slice of `positions` to render.
+    Each key (include the filter in it) remembers its own page.
+    """
+    size_key = f"{key}_page_size"
+    if size_key not in st.session_state:
+        st.session_state[size_key] = page_size or PAGE_SIZE
+    size = st.session_state[size_key]
+    pages = max(1, -(-len(positions) // size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages  # The list shrank (new batch, bigger pages)
+
+    col1, col2, col3 = st.columns([1, 1, 3])
+    with col1:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+    with col2:
+        sizes = sorted(set(PAGE_SIZES) | {size})
+        st.selectbox("Per page", sizes, key=size_key)
+    start = (page - 1) * size
+    with col3:
+        st.caption(f"{start + 1 if positions else 0}–{min(start + size, len(positions))} of {len(positions)} · page {page}/{pages}")
+    return positions[start:start + size]
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _fragment_cache(filename, version, renderer):
+    return {}
+
+def _renderer_key(render):
+    # Pages all run as __main__, so the name alone can't tell their renderers apart
+    code = render.__code__
+    return f"{code.co_filename}:{code.co_firstlineno}:{render.__qualname__}"
+
+def item_fragments(filename, render, positions, key=None):
+    """
+    HTML for the items at `positions`, built by render(item) once per item and data
+    version and then shared by every rerun and session. Cached per renderer: its
+    source file and line, or `key` for callables without one (e.g. partials).
+    """
+    version = data_version(filename)
+    data = _cached_data(filename, version) or []
+    cache = _fragment_cache(filename, version, key or _renderer_key(render))
+    fragments = []
+    for i in positions:
+        html = cache.get(i)
+        if html is None:
+            html = cache[i] = render(data[i])
+        fragments.append(html)
+    return fragments
+
+@st.cache_resource(show_spinner=False)
+def get_config_loader():
+    """One ConfigLoader per process; its snapshot reloads by itself when the YAML files change."""
+    return ConfigLoader()
+
+def load_channels():
+    return get_config_loader().load_channels()
+
 def save_data(filename, data):
-    output_dir = Path("outputs")
-    output_dir.mkdir(exist_ok=True)
-    with open(output_dir / filename, "w") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store = get_item_store()
+    if filename == PAPERS_FILE:
+        store.save_papers_batch(data)
+    elif filename in FEED_SECTIONS:
+        store.save_feed_batch(FEED_SECTIONS[filename], data)
+    elif filename in DOCUMENT_KINDS:
+        store.save_document(DOCUMENT_KINDS[filename], data)
+    elif filename == ANALYSES_FILE:
+        for paper_id, analysis in data.items():
+            store.save_analysis(paper_id, analysis["type"], analysis["data"])
+    else:
+        output_dir = Path("outputs")
+        output_dir.mkdir(exist_ok=True)
+        with open(output_dir / filename, "w") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
-def last_updated_component(filename):
+def save_analysis(paper_id, analysis_type, data):
+    """Stores a single paper analysis without rewriting the others."""
+    get_item_store().save_analysis(paper_id, analysis_type, data)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _last_updated(filename, version):
+    section = _section(filename)
+    if section is not None:
+        return get_item_store().last_updated(section)
     path = Path(f"outputs/{filename}")
-    if path.exists():
-        # Get modification time
-        mtime = datetime.fromtimestamp(path.stat().st_mtime)
+    return path.stat().st_mtime if path.exists() else None
+
+def last_updated_component(filename):
+    updated_at = _last_updated(filename, data_version(filename))
+    if updated_at:
+        mtime = datetime.fromtimestamp(updated_at)
         st.caption(f"Last updated: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
     else:
         st.caption("No data cached.")
@@ -0,0 +1,80 @@
+"""
+Background refresh daemon: keeps every section's snapshot in the item store fresh
+so the Streamlit pages only ever read.
+
+    python refresh_daemon.py                   # run until Ctrl-C / SIGTERM
+    python refresh_daemon.py --once            # refresh everything once (cron-friendly)
+    python refresh_daemon.py --only discourse,news
+"""
+import argparse
+import logging
+import os
+import signal
+from typing import Dict, List, Optional, Tuple
+from core.miners.refresh import FETCHERS, refresh
+from core.utils.config_loader import ConfigLoader
+from core.utils.item_store import get_item_store
+from core.utils.metrics import start_metrics_server
+from core.utils.scheduler import Job, Scheduler
+
+# section -> (refresh interval in seconds, priority; lower goes first when workers are busy).
+# RADAR_REFRESH_<SECTION>=<seconds> overrides an interval; 0 disables the section.
+SCHEDULE: Dict[str, Tuple[int, int]] = {
+    "discourse": (300, 0),   # HN / Reddit move fastest
+    "news": (900, 1),
+    "papers": (3600, 2),     # incremental ArXiv scan
+    "podcasts": (3600, 3),
+    "products": (3600, 3),
+}
+REFRESH_JITTER = float(os.getenv("RADAR_REFRESH_JITTER", "0.1"))
+REFRESH_WORKERS = int(os.getenv("RADAR_REFRESH_WORKERS", "2"))
+
+
+def build_jobs(only: Optional[List[str]] = None) -> List[Job]:
+    config = ConfigLoader()
+    store = get_item_store()
+    jobs = []
+    for section, (interval, priority) in SCHEDULE.items():
+        if only and section not in only:
+            continue
+        interval = int(os.getenv(f"RADAR_REFRESH_{section.upper()}", str(interval)))
+        if interval <= 0:
+            continue
+        jobs.append(Job(
+            name=section,
+            fn=lambda section=section: refresh(section, config, store),
+            interval_s=interval,
+            priority=priority,
+            jitter=REFRESH_JITTER,
+            last_run=lambda section=section: store.last_updated(section),
+        ))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="refresh every section once and exit")
+    parser.add_argument("--only", default="", help=f"comma-separated subset of {', '.join(FETCHERS)}")
+    parser.add_argument("--workers", type=int, default=REFRESH_WORKERS)
+    args = parser.parse_args()
+
+    only = [s.strip() for s in args.only.split(",") if s.strip()]
+    unknown = [s for s in only if s not in SCHEDULE]
+    if unknown:
+        parser.error(f"unknown sections {unknown}")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    start_metrics_server()
+    scheduler = Scheduler(build_jobs(only), max_workers=args.workers)
+    if args.once:
+        for section, outcome in scheduler.run_once().items():
+            print(f"{section:<10} {outcome}")
+        return
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: scheduler.stop())
+    scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    main()
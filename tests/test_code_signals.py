@@ -0,0 +1,107 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.utils.code_signals import GRAPHQL_BATCH_SIZE, CodeSignals
+
+STARS = {"openai/gpt-2": 21000, "karpathy/nanogpt": 33000, "huggingface/transformers": 130000}
+
+
+class StubGitHub(BaseHTTPRequestHandler):
+    """GraphQL + REST stand-in for api.github.com; records every request it answers."""
+
+    requests = []
+    graphql_status = 200
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        variables = payload["variables"]
+        aliases = re.findall(r"(r\d+): repository\(owner: \$(o\d+), name: \$(n\d+)\)", payload["query"])
+        self.requests.append(("graphql", len(aliases)))
+        if self.graphql_status != 200:
+            return self._reply(self.graphql_status, {"message": "unavailable"})
+
+        data, errors = {}, []
+        for alias, owner, name in aliases:
+            repo = f"{variables[owner]}/{variables[name]}".lower()
+            if repo in STARS:
+                data[alias] = {"stargazerCount": STARS[repo]}
+            else:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias]})
+        self._reply(200, {"data": data, "errors": errors} if errors else {"data": data})
+
+    def do_GET(self):
+        repo = self.path.split("/repos/", 1)[-1].lower()
+        self.requests.append(("rest", repo))
+        if repo in STARS:
+            self._reply(200, {"stargazers_count": STARS[repo]})
+        else:
+            self._reply(404, {"message": "Not Found"})
+
+
+@pytest.fixture
+def github(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "stub-token")
+    StubGitHub.requests = []
+    StubGitHub.graphql_status = 200
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitHub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def signals(url):
+    return CodeSignals(pool_size=2, use_cache=False, github_api_url=url)
+
+
+def test_aliases_map_back_to_their_repos(github):
+    cs = signals(github)
+    urls = [f"https://github.com/{repo}" for repo in STARS]
+
+    assert cs.prefetch_github_stars(reversed(urls)) == STARS
+    assert StubGitHub.requests == [("graphql", 3)]
+    assert [cs.get_github_stars(url) for url in urls] == list(STARS.values())
+    assert StubGitHub.requests == [("graphql", 3)]
+
+
+def test_missing_repos_are_negative_results_not_rest_lookups(github):
+    cs = signals(github)
+
+    resolved = cs.prefetch_github_stars(["https://github.com/openai/gpt-2", "https://github.com/nobody/gone"])
+    assert resolved == {"openai/gpt-2": 21000}
+    assert cs.get_github_stars("https://github.com/nobody/gone") == 0
+    assert StubGitHub.requests == [("graphql", 2)]
+
+
+def test_failed_graphql_falls_back_to_rest(github):
+    StubGitHub.graphql_status = 400
+    cs = signals(github)
+
+    assert cs.prefetch_github_stars(["https://github.com/karpathy/nanoGPT"]) == {}
+    assert cs.get_github_stars("https://github.com/karpathy/nanoGPT") == 33000
+    assert StubGitHub.requests == [("graphql", 1), ("rest", "karpathy/nanogpt")]
+
+
+def test_large_batches_are_split(github):
+    cs = signals(github)
+    urls = [f"https://github.com/owner{i}/repo{i}" for i in range(GRAPHQL_BATCH_SIZE * 2 + 5)]
+
+    assert cs.prefetch_github_stars(urls) == {}
+    assert StubGitHub.requests == [("graphql", GRAPHQL_BATCH_SIZE), ("graphql", GRAPHQL_BATCH_SIZE), ("graphql", 5)]